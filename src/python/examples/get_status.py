@@ -1,7 +1,7 @@
 import argparse
-import json
 
 from vaonis_instruments import VaonisHTTPClient
+from vaonis_instruments._json import dumps
 from vaonis_instruments.logging_utils import format_payload, setup_logging
 
 
@@ -17,15 +17,17 @@ def main() -> int:
         status = client.get_status()
         log.logger.info("Status response received")
         if args.json:
-            print(json.dumps(status, ensure_ascii=True))
+            print(dumps(status))
         else:
             print(format_payload(status, color=True))
     except Exception as exc:
         log.logger.exception("Failed to get status: %s", exc)
         if args.json:
-            print(json.dumps({"ok": False, "error": str(exc)}, ensure_ascii=True))
+            print(dumps({"ok": False, "error": str(exc)}))
             return 1
         raise
+    finally:
+        client.close()
     return 0
 
 
@@ -1,9 +1,12 @@
 import argparse
-import json
-import time
-from typing import Any, Optional
+import queue
+import signal
+import sys
+import threading
+from typing import Any, Optional, Tuple
 
 from vaonis_instruments import VaonisSocketClient
+from vaonis_instruments._json import dumps, dumps_bytes
 from vaonis_instruments.logging_utils import format_payload, setup_logging
 
 # Replace with values from your setup.
@@ -28,11 +31,9 @@ def main() -> int:
 
     def emit(event: str, payload: Optional[Any] = None) -> None:
         if args.json:
-            print(
-                json.dumps(
-                    {"event": event, "payload": payload},
-                    ensure_ascii=True,
-                )
+            # One buffered write per event; the buffer is flushed on shutdown.
+            sys.stdout.buffer.write(
+                dumps_bytes({"event": event, "payload": payload}) + b"\n"
             )
             return
         if payload is None:
@@ -44,17 +45,34 @@ def main() -> int:
         except Exception:
             print(payload)
 
+    # Socket.IO callbacks only enqueue; a writer thread does the JSON
+    # encoding and printing so the network thread never blocks on output.
+    events: "queue.SimpleQueue[Optional[Tuple[str, Any]]]" = queue.SimpleQueue()
+    stop = threading.Event()
+
+    def _writer() -> None:
+        while True:
+            item = events.get()
+            if item is None:
+                break
+            emit(*item)
+
+    writer = threading.Thread(target=_writer, daemon=True)
+    writer.start()
+
     def on_status(payload):
-        emit("STATUS_UPDATED", payload)
+        events.put(("STATUS_UPDATED", payload))
 
     def on_control_error(payload):
-        emit("CONTROL_ERROR", payload)
+        events.put(("CONTROL_ERROR", payload))
 
     def on_connect(*_args, **_kwargs):
-        emit("connect")
+        events.put(("connect", None))
 
     def on_disconnect(*_args, **_kwargs):
-        emit("disconnect")
+        # Transient drops reconnect on their own (socketio defaults to
+        # reconnection=True); only a signal ends the listener.
+        events.put(("disconnect", None))
 
     sock.on_status_updated(on_status)
     sock.on_control_error(on_control_error)
@@ -63,24 +81,31 @@ def main() -> int:
 
     try:
         sock.connect()
-        emit("listening")
+        events.put(("listening", None))
     except Exception as exc:
         log.logger.exception("Socket connect failed: %s", exc)
         if args.json:
-            print(json.dumps({"ok": False, "error": str(exc)}, ensure_ascii=True))
+            print(dumps({"ok": False, "error": str(exc)}))
             return 1
         raise
 
+    def _handle_signal(_signum, _frame) -> None:
+        stop.set()
+
+    signal.signal(signal.SIGINT, _handle_signal)
+    signal.signal(signal.SIGTERM, _handle_signal)
+
     try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        pass
+        # Sleep until a signal arrives instead of polling once a second.
+        stop.wait()
     finally:
         try:
             sock.disconnect()
         except Exception:
             pass
+        events.put(None)
+        writer.join(timeout=5)
+        sys.stdout.buffer.flush()
     return 0
 
 
@@ -4,10 +4,10 @@ This uses the local auth key extractor to generate a valid Authorization header.
 """
 
 import argparse
-import json
 
 from vaonis_instruments import AuthContext, VaonisHTTPClient, build_authorization_header
 from vaonis_instruments import ensure_auth_key
+from vaonis_instruments._json import dumps
 from vaonis_instruments.logging_utils import format_payload, setup_logging
 
 
@@ -41,15 +41,17 @@ def main() -> int:
         response = client.start_observation(auth, body)
         log.logger.info("Start observation response received")
         if args.json:
-            print(json.dumps(response, ensure_ascii=True))
+            print(dumps(response))
         else:
             print(format_payload(response, color=True))
     except Exception as exc:
         log.logger.exception("Start observation failed: %s", exc)
         if args.json:
-            print(json.dumps({"ok": False, "error": str(exc)}, ensure_ascii=True))
+            print(dumps({"ok": False, "error": str(exc)}))
             return 1
         raise
+    finally:
+        client.close()
     return 0
 
 
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+def _load_tool_module(name: str) -> Any:
+    root = Path(__file__).resolve().parents[3]
+    module_path = root / "tools" / f"{name}.py"
+    spec = spec_from_file_location(name, module_path)
+    assert spec is not None
+    module = module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def build_schema_bundle_module() -> Any:
+    return _load_tool_module("build_schema_bundle")
+
+
+@pytest.fixture(scope="session")
+def extract_auth_key_module() -> Any:
+    return _load_tool_module("extract_auth_key")
@@ -3,7 +3,12 @@ from pathlib import Path
 
 import pytest
 
-from vaonis_instruments.auth import AuthContext, build_authorization_header
+from vaonis_instruments.auth import (
+    AuthContext,
+    build_authorization_header,
+    sign_batch,
+    verify_batch,
+)
 from vaonis_instruments.auth import _build_payload, _resolve_key_material, _sign_ed25519
 
 
@@ -40,3 +45,17 @@ def test_sign_ed25519_with_seed():
     message = b"data"
     signature = _sign_ed25519(message, b"\x02" * 32)
     assert len(signature) == len(message) + 64
+
+
+def test_sign_batch_matches_single_signatures():
+    from nacl import signing
+
+    seed = b"\x02" * 32
+    messages = [b"one", b"two", b"three"]
+    signed = sign_batch(messages, seed)
+
+    assert signed == [_sign_ed25519(message, seed) for message in messages]
+
+    verify_key = bytes(signing.SigningKey(seed).verify_key)
+    assert verify_batch([(verify_key, item) for item in signed])
+    assert not verify_batch([(verify_key, signed[0][:-1] + b"\x00")])
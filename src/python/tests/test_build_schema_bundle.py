@@ -1,60 +1,68 @@
 from __future__ import annotations
 
 import json
-from importlib.util import module_from_spec, spec_from_file_location
+import shutil
 from pathlib import Path
 from typing import Any
 
+import pytest
+
+from vaonis_instruments._json import dumps_pretty
+
 
 def _write_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(data, indent=2, sort_keys=True, ensure_ascii=True) + "\n",
-        encoding="utf-8",
-    )
+    path.write_text(dumps_pretty(data) + "\n", encoding="utf-8")
 
 
-def _load_module() -> Any:
-    root = Path(__file__).resolve().parents[3]
-    module_path = root / "tools" / "build_schema_bundle.py"
-    spec = spec_from_file_location("build_schema_bundle", module_path)
-    assert spec is not None
-    module = module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)
-    return module
+@pytest.fixture(scope="session")
+def _schema_skeleton(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Invariant schema files, written once and copied into each test tree."""
+    base = tmp_path_factory.mktemp("schema_skeleton")
+    schemas_root = base / "src" / "unified" / "schemas"
+    _write_json(schemas_root / "http" / "SettingsBody.json", {"title": "SettingsBody"})
+    _write_json(schemas_root / "http" / "ThingBody.json", {"title": "ThingBody"})
+    _write_json(
+        schemas_root / "events" / "STATUS_UPDATED.json", {"title": "STATUS_UPDATED"}
+    )
+    _write_json(
+        schemas_root / "socket" / "getStatus.response.json",
+        {"title": "getStatus.response"},
+    )
+    return base
 
 
-def test_build_schema_bundle_routes_from_extracted(tmp_path: Path) -> None:
-    module = _load_module()
+def test_build_schema_bundle_routes_from_extracted(
+    build_schema_bundle_module: Any,
+    _schema_skeleton: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = build_schema_bundle_module
+    shutil.copytree(_schema_skeleton, tmp_path, dirs_exist_ok=True)
 
-    module.ROOT = tmp_path
-    module.SCHEMAS_ROOT = tmp_path / "src" / "unified" / "schemas"
-    module.HTTP_SCHEMA_DIR = module.SCHEMAS_ROOT / "http"
-    module.EVENTS_SCHEMA_DIR = module.SCHEMAS_ROOT / "events"
-    module.SOCKET_SCHEMA_DIR = module.SCHEMAS_ROOT / "socket"
-    module.HTTP_ENDPOINTS = (
-        tmp_path / "src" / "unified" / "data" / "api_full" / "http_endpoints.json"
+    schemas_root = tmp_path / "src" / "unified" / "schemas"
+    monkeypatch.setattr(module, "ROOT", tmp_path)
+    monkeypatch.setattr(module, "SCHEMAS_ROOT", schemas_root)
+    monkeypatch.setattr(module, "HTTP_SCHEMA_DIR", schemas_root / "http")
+    monkeypatch.setattr(module, "EVENTS_SCHEMA_DIR", schemas_root / "events")
+    monkeypatch.setattr(module, "SOCKET_SCHEMA_DIR", schemas_root / "socket")
+    monkeypatch.setattr(
+        module,
+        "HTTP_ENDPOINTS",
+        tmp_path / "src" / "unified" / "data" / "api_full" / "http_endpoints.json",
     )
-    module.EXTRACTED_ENDPOINTS = (
+    monkeypatch.setattr(
+        module,
+        "EXTRACTED_ENDPOINTS",
         tmp_path
         / "src"
         / "unified"
         / "data"
         / "api_extracted"
-        / "stellina_api_endpoints.json"
-    )
-    module.OUT_PATH = module.SCHEMAS_ROOT / "schema_bundle.json"
-
-    _write_json(module.HTTP_SCHEMA_DIR / "SettingsBody.json", {"title": "SettingsBody"})
-    _write_json(module.HTTP_SCHEMA_DIR / "ThingBody.json", {"title": "ThingBody"})
-    _write_json(
-        module.EVENTS_SCHEMA_DIR / "STATUS_UPDATED.json", {"title": "STATUS_UPDATED"}
-    )
-    _write_json(
-        module.SOCKET_SCHEMA_DIR / "getStatus.response.json",
-        {"title": "getStatus.response"},
+        / "stellina_api_endpoints.json",
     )
+    monkeypatch.setattr(module, "OUT_PATH", schemas_root / "schema_bundle.json")
 
     _write_json(
         module.HTTP_ENDPOINTS,
@@ -9,8 +9,8 @@ def test_get_status_builds_url():
     fake_resp.json.return_value = {"ok": True}
     fake_resp.raise_for_status.return_value = None
 
-    with patch(
-        "vaonis_instruments.http_client.requests.request", return_value=fake_resp
+    with patch.object(
+        client._session, "request", return_value=fake_resp
     ) as request:
         resp = client.get_status()
 
@@ -27,8 +27,8 @@ def test_auth_header_is_set():
     fake_resp.json.return_value = {"ok": True}
     fake_resp.raise_for_status.return_value = None
 
-    with patch(
-        "vaonis_instruments.http_client.requests.request", return_value=fake_resp
+    with patch.object(
+        client._session, "request", return_value=fake_resp
     ) as request:
         client.start_observation("token", {})
 
@@ -82,7 +82,8 @@ def test_download_image_accepts_image_like_content(
             raise requests.HTTPError("bad")
 
     monkeypatch.setattr(
-        "vaonis_instruments.http_client.requests.get",
+        client._session,
+        "get",
         lambda *args, **kwargs: seen.update(kwargs) or ImageResponse(),
     )
 
@@ -105,7 +106,8 @@ def test_download_image_raises_for_non_image(monkeypatch: pytest.MonkeyPatch) ->
             raise requests.HTTPError("bad")
 
     monkeypatch.setattr(
-        "vaonis_instruments.http_client.requests.get",
+        client._session,
+        "get",
         lambda *args, **kwargs: TextResponse(),
     )
 
@@ -34,8 +34,9 @@ def test_request_error_logs(tmp_path) -> None:
     logger = configure_logger("http_test", log_path)
     client = VaonisHTTPClient(logger=logger)
 
-    with patch(
-        "vaonis_instruments.http_client.requests.request",
+    with patch.object(
+        client._session,
+        "request",
         side_effect=requests.RequestException("boom"),
     ):
         with pytest.raises(requests.RequestException):
@@ -55,9 +56,7 @@ def test_request_logs_payload(tmp_path) -> None:
     fake_resp.raise_for_status.return_value = None
     fake_resp.json.return_value = {"ok": True}
 
-    with patch(
-        "vaonis_instruments.http_client.requests.request", return_value=fake_resp
-    ):
+    with patch.object(client._session, "request", return_value=fake_resp):
         client.get_status()
 
     payload = log_path.read_text(encoding="utf-8")
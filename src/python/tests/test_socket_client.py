@@ -44,12 +44,22 @@ class FakeLogger:
     def info(self, message: str, *args: Any) -> None:
         self.messages.append(message % args if args else message)
 
+    def isEnabledFor(self, _level: int) -> bool:
+        return True
+
+
+# The socketio stand-in is stateless (client state lives on instances),
+# so patch once per module instead of per test.
+@pytest.fixture(scope="module")
+def fake_socketio() -> Any:
+    patcher = pytest.MonkeyPatch()
+    patcher.setattr(socket_client, "socketio", FakeSocketIOModule)
+    yield FakeSocketIOModule
+    patcher.undo()
+
 
 @pytest.fixture
-def socketio_client(
-    monkeypatch: pytest.MonkeyPatch,
-) -> socket_client.VaonisSocketClient:
-    monkeypatch.setattr(socket_client, "socketio", FakeSocketIOModule)
+def socketio_client(fake_socketio: Any) -> socket_client.VaonisSocketClient:
     logger = FakeLogger()
     return socket_client.VaonisSocketClient(
         device_id="device-id",
@@ -83,8 +93,28 @@ def test_socket_connect_and_emit(
     )
 
 
-def test_socket_event_wrapping(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(socket_client, "socketio", FakeSocketIOModule)
+def test_socket_batch_defers_and_preserves_order(
+    socketio_client: socket_client.VaonisSocketClient,
+) -> None:
+    socketio_client.connect()
+    sio = socketio_client._sio
+    assert isinstance(sio, FakeSocketIOClient)
+
+    with socketio_client.batch():
+        socketio_client.take_control()
+        socketio_client.set_system_time(1234)
+        assert sio.emitted == []
+
+    assert sio.emitted == [
+        ("message", ["takeControl"]),
+        ("message", ["setSystemTime", 1234]),
+    ]
+
+    socketio_client.release_control()
+    assert sio.emitted[-1] == ("message", ["releaseControl"])
+
+
+def test_socket_event_wrapping(fake_socketio: Any) -> None:
     logger = FakeLogger()
     client = socket_client.VaonisSocketClient(event_logger=logger)
     received: List[Any] = []
@@ -3,13 +3,18 @@ from unittest.mock import Mock
 from vaonis_instruments.unified_client import UnifiedHTTPClient
 
 
+def _make_response() -> Mock:
+    resp = Mock()
+    resp.json.return_value = {"ok": True}
+    resp.raise_for_status.return_value = None
+    return resp
+
+
 def test_call_operation_uses_route_manifest():
     client = UnifiedHTTPClient()
     client.base_url = "http://example:8082/v1"
 
-    fake_resp = Mock()
-    fake_resp.json.return_value = {"ok": True}
-    fake_resp.raise_for_status.return_value = None
+    fake_resp = _make_response()
     client.session.request = Mock(return_value=fake_resp)
 
     resp = client.call_operation("appGetStatus")
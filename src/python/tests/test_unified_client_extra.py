@@ -8,12 +8,16 @@ import requests
 from vaonis_instruments.unified_client import UnifiedHTTPClient, _looks_like_image
 
 
+def _make_response(*, ok: bool = True) -> Mock:
+    resp = Mock()
+    resp.ok = ok
+    return resp
+
+
 def test_detect_base_url_success() -> None:
     client = UnifiedHTTPClient(prefixes=["", "/stellina/http"])
-    good_resp = Mock()
-    good_resp.ok = True
-    bad_resp = Mock()
-    bad_resp.ok = False
+    good_resp = _make_response()
+    bad_resp = _make_response(ok=False)
     client.session.get = Mock(side_effect=[bad_resp, good_resp])
 
     base = client.detect_base_url()
@@ -32,8 +36,7 @@ def test_detect_base_url_failure() -> None:
 def test_download_image_accepts_bytes() -> None:
     client = UnifiedHTTPClient()
     client.base_url = "http://example:8082/v1"
-    resp = Mock()
-    resp.ok = False
+    resp = _make_response(ok=False)
     resp.content = b"\xff\xd8\xff\x00"
     resp.headers = {"content-type": "application/octet-stream"}
     client.session.get = Mock(return_value=resp)
@@ -8,12 +8,23 @@ app. This package intentionally does not ship the vendor key material required t
 that header.
 """
 
-from .auth import AuthContext, build_authorization_header
-from .auth_key_extractor import ensure_auth_key
-from .logging_utils import format_payload, setup_logging
-from .http_client import VaonisHTTPClient
-from .socket_client import StellinaSocketV2Client, VaonisSocketClient
-from .unified_client import UnifiedHTTPClient
+import importlib
+from typing import Any, List
+
+# PEP 562 lazy imports: importing the package no longer pulls requests,
+# socketio, or the extractor's subprocess/zipfile machinery until the
+# corresponding name is actually used.
+_LAZY = {
+    "AuthContext": "auth",
+    "build_authorization_header": "auth",
+    "ensure_auth_key": "auth_key_extractor",
+    "format_payload": "logging_utils",
+    "setup_logging": "logging_utils",
+    "VaonisHTTPClient": "http_client",
+    "StellinaSocketV2Client": "socket_client",
+    "VaonisSocketClient": "socket_client",
+    "UnifiedHTTPClient": "unified_client",
+}
 
 __all__ = [
     "AuthContext",
@@ -26,3 +37,17 @@ __all__ = [
     "format_payload",
     "setup_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,73 @@
+"""Internal JSON helpers with an optional orjson fast path.
+
+orjson serializes significantly faster than the stdlib encoder; when it is
+not installed these helpers fall back to :mod:`json` with equivalent output
+semantics (``indent=2, sort_keys=True`` pretty, non-string keys coerced).
+One known divergence: orjson emits UTF-8 where the stdlib path escapes
+non-ASCII characters (``ensure_ascii``); both are valid JSON.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - exercised only when orjson is installed
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
+__all__ = ["dumps", "dumps_bytes", "dumps_pretty", "dumps_pretty_bounded", "loads"]
+
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, sort_keys=True, ensure_ascii=True)
+
+
+def dumps(value: Any) -> str:
+    """Serialize ``value`` to a compact JSON string."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value, ensure_ascii=True)
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """Serialize ``value`` to compact JSON bytes (no trailing newline)."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=True).encode("utf-8")
+
+
+def dumps_pretty(value: Any) -> str:
+    """Serialize ``value`` with two-space indentation and sorted keys."""
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return json.dumps(value, indent=2, sort_keys=True, ensure_ascii=True)
+
+
+def dumps_pretty_bounded(value: Any, max_len: int) -> str:
+    """Like :func:`dumps_pretty`, but stop emitting once ``max_len`` is hit.
+
+    With orjson the one-shot serialization is cheap enough that slicing
+    afterwards wins; the stdlib path uses the incremental encoder so the
+    worst case stays O(max_len) rather than O(payload). Output longer
+    than ``max_len`` means the result was cut mid-document.
+    """
+    if orjson is not None:
+        return dumps_pretty(value)[: max_len + 1]
+    pieces = []
+    emitted = 0
+    for chunk in _PRETTY_ENCODER.iterencode(value):
+        pieces.append(chunk)
+        emitted += len(chunk)
+        if emitted > max_len:
+            break
+    return "".join(pieces)
+
+
+def loads(data: Any) -> Any:
+    """Deserialize JSON from ``str`` or ``bytes``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -14,12 +14,29 @@ Do NOT attempt to access devices you do not own or have explicit permission to c
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import base64
 import hashlib
 import os
 import tempfile
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    from nacl import bindings, exceptions as nacl_exceptions, signing  # type: ignore
+
+    _nacl_import_error: Optional[Exception] = None
+except Exception as e:  # pragma: no cover
+    bindings = nacl_exceptions = signing = None  # type: ignore
+    _nacl_import_error = e
+
+
+def _require_nacl() -> None:
+    if signing is None:
+        raise ImportError(
+            "PyNaCl is required for Ed25519 signatures. "
+            "Install with: pip install pynacl"
+        ) from _nacl_import_error
 
 
 @dataclass
@@ -44,9 +61,13 @@ def build_authorization_header(
     payload = _build_payload(ctx)
     digest = hashlib.sha512(payload).digest()
     signed_message = _sign_ed25519(digest, key_bytes)
-    signature_b64 = base64.b64encode(signed_message).decode("ascii")
-    prefix = ctx.challenge[0]
-    return f"Basic android|{prefix}|{signature_b64}"
+    signature_b64 = base64.b64encode(signed_message)
+    # Join at the bytes level and decode once, instead of decoding the
+    # signature and re-joining through an f-string.
+    header = b"".join(
+        (b"Basic android|", ctx.challenge[0].encode("ascii"), b"|", signature_b64)
+    )
+    return header.decode("ascii")
 
 
 def _resolve_key_material(
@@ -77,7 +98,10 @@ def _is_within_root(root: Path, target: Path) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def _allowed_key_roots() -> list[Path]:
+    # Stable for the lifetime of the process; avoids re-resolving
+    # cwd/home/tempdir and re-probing the repo root per key-path check.
     roots = [Path.cwd(), Path.home(), Path(tempfile.gettempdir())]
     roots.append(Path(__file__).resolve().parents[1])
     try:
@@ -130,23 +154,56 @@ def _build_payload(ctx: AuthContext) -> bytes:
         raise ValueError("challenge must include a prefix + base64 payload")
     challenge_bytes = base64.b64decode(ctx.challenge[1:])
     tail = f"|{ctx.telescope_id}|{ctx.boot_count}".encode("utf-8")
-    return challenge_bytes + tail
+    # Assemble into one preallocated buffer so hashlib sees a single
+    # contiguous payload instead of a freshly concatenated bytes object.
+    buf = bytearray(len(challenge_bytes) + len(tail))
+    buf[: len(challenge_bytes)] = challenge_bytes
+    buf[len(challenge_bytes) :] = tail
+    return bytes(buf)
 
 
-def _sign_ed25519(message: bytes, key_bytes: bytes) -> bytes:
-    try:
-        from nacl import bindings, signing  # type: ignore
-    except Exception as exc:  # pragma: no cover
-        raise ImportError(
-            "PyNaCl is required for Ed25519 signatures. "
-            "Install with: pip install pynacl"
-        ) from exc
+@lru_cache(maxsize=4)
+def _signing_key(seed: bytes) -> "signing.SigningKey":
+    # Key expansion from the 32-byte seed is the expensive half of a
+    # signature; reuse the expanded key for repeated auth calls.
+    return signing.SigningKey(seed)
 
+
+def _sign_ed25519(message: bytes, key_bytes: bytes) -> bytes:
+    _require_nacl()
     if len(key_bytes) == 64:
         return bindings.crypto_sign(message, key_bytes)
     if len(key_bytes) == 32:
-        return bytes(signing.SigningKey(key_bytes).sign(message))
+        return bytes(_signing_key(key_bytes).sign(message))
     raise ValueError(f"Unexpected Ed25519 key length: {len(key_bytes)} bytes")
 
 
-__all__ = ["AuthContext", "build_authorization_header"]
+def sign_batch(messages: Iterable[bytes], seed: bytes) -> List[bytes]:
+    """Sign several messages with one Ed25519 key.
+
+    The expensive key expansion happens once instead of per message; each
+    returned item is the signed message (signature + message) for the
+    corresponding input.
+    """
+    _require_nacl()
+    if len(seed) != 32:
+        raise ValueError(f"Unexpected Ed25519 seed length: {len(seed)} bytes")
+    key = _signing_key(seed)
+    return [bytes(key.sign(message)) for message in messages]
+
+
+def verify_batch(items: Sequence[Tuple[bytes, bytes]]) -> bool:
+    """Verify (verify_key_bytes, signed_message) pairs in one pass.
+
+    Returns True only if every signed message opens under its key.
+    """
+    _require_nacl()
+    for verify_key_bytes, signed_message in items:
+        try:
+            signing.VerifyKey(verify_key_bytes).verify(signed_message)
+        except nacl_exceptions.BadSignatureError:
+            return False
+    return True
+
+
+__all__ = ["AuthContext", "build_authorization_header", "sign_batch", "verify_batch"]
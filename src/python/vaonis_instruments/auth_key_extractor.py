@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
 import base64
+import binascii
+import hashlib
+import mmap
+import os
 from pathlib import Path
 import re
 import subprocess
+import sys
 import tempfile
 from typing import Callable, Iterable, List, Optional, Union
 import zipfile
 
 from .logging_utils import find_repo_root
 
+try:  # pragma: no cover - exercised only when hyperscan is installed
+    import hyperscan  # type: ignore
+except Exception:  # pragma: no cover
+    hyperscan = None
+
 
 class AuthKeyError(RuntimeError):
     """Raised when auth key extraction fails."""
@@ -27,9 +38,52 @@ class MultipleAuthKeysFound(AuthKeyError):
     """Raised when more than one auth key is detected."""
 
 
-BASE64_RE = re.compile(r"^[A-Za-z0-9+/]+={0,2}$")
-METHOD_RE = re.compile(r"\.method[^\n]*getAuthHeader[^\n]*\n(.*?)\n\.end method", re.S)
-STRING_RE = re.compile(r'const-string(?:/jumbo)?\s+v\d+,\s+"([^"]+)"')
+# Compiled once and matched against raw bytes so smali files never need a
+# str decode pass. A 64-byte key is 86 base64 characters plus padding, so
+# the pattern rejects wrong-length strings before any decode attempt.
+METHOD_RE = re.compile(
+    rb"\.method[^\n]*getAuthHeader[^\n]*\n(.*?)\n\.end method", re.S
+)
+_CANDIDATE_RE = re.compile(rb'"([A-Za-z0-9+/]{86,88}={0,2})"')
+
+_HS_DB = None
+
+
+def _hyperscan_db():
+    """Compile the candidate pattern into a Hyperscan database once."""
+    global _HS_DB
+    if _HS_DB is None:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[_CANDIDATE_RE.pattern],
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+        )
+        _HS_DB = db
+    return _HS_DB
+
+
+def _scan_candidates(buf: bytes) -> List[str]:
+    """Return validated key candidates found anywhere in ``buf``.
+
+    Uses Hyperscan's DFA scanner when the optional native lib is installed;
+    otherwise falls back to the compiled stdlib pattern.
+    """
+    if hyperscan is not None:
+        hits: List[bytes] = []
+
+        def _on_match(_id: int, start: int, end: int, _flags: int, _ctx) -> None:
+            hits.append(buf[start:end].strip(b'"'))
+
+        _hyperscan_db().scan(buf, match_event_handler=_on_match)
+        raws = hits
+    else:
+        raws = [match.group(1) for match in _CANDIDATE_RE.finditer(buf)]
+    candidates: List[str] = []
+    for raw_bytes in raws:
+        raw = raw_bytes.decode("ascii")
+        if _decode_base64(raw) is not None:
+            candidates.append(raw)
+    return candidates
 
 
 @dataclass
@@ -46,7 +100,10 @@ def default_apktool_jar() -> Path:
     return find_repo_root() / "tools" / "apktool_2.9.3.jar"
 
 
+@lru_cache(maxsize=1)
 def _allowed_roots() -> list[Path]:
+    # The roots never change within a process; every _normalize_safe_path
+    # call used to re-resolve cwd/home/tempdir and re-probe the repo root.
     roots = [Path.cwd(), Path.home(), Path(tempfile.gettempdir())]
     roots.append(Path(__file__).resolve().parents[1])
     try:
@@ -56,22 +113,27 @@ def _allowed_roots() -> list[Path]:
     return roots
 
 
-def _is_within_root(root: Path, target: Path) -> bool:
-    try:
-        target.relative_to(root)
-        return True
-    except ValueError:
-        return False
-
-
-def _normalize_safe_path(path: Union[str, Path]) -> Path:
-    resolved = Path(path).expanduser().resolve(strict=False)
+@lru_cache(maxsize=1)
+def _allowed_root_strings() -> tuple[str, ...]:
+    # Resolved once so the per-path check below is pure string work with
+    # no readlink/stat chain per root.
+    resolved = []
     for root in _allowed_roots():
         try:
-            root_resolved = root.resolve(strict=False)
+            resolved.append(str(root.resolve(strict=False)))
         except Exception:
             continue
-        if _is_within_root(root_resolved, resolved):
+    return tuple(resolved)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_safe_path(path: Union[str, Path]) -> Path:
+    # Keyed on the raw argument: the same path is normalized several
+    # times per extraction run and each resolve() hits the kernel.
+    resolved = Path(path).expanduser().resolve(strict=False)
+    resolved_str = str(resolved)
+    for root in _allowed_root_strings():
+        if resolved_str == root or resolved_str.startswith(root + os.sep):
             return resolved
     raise AuthKeyError(f"Path outside allowed roots: {resolved}")
 
@@ -82,31 +144,56 @@ def _normalize_optional_path(path: Optional[Union[str, Path]]) -> Optional[Path]
     return _normalize_safe_path(path)
 
 
-def _decode_base64(value: str) -> Optional[bytes]:
-    try:
-        return base64.b64decode(value, validate=True)
-    except Exception:
-        return None
+if sys.version_info >= (3, 11):
 
+    def _decode_base64(value: str) -> Optional[bytes]:
+        # binascii skips base64.b64decode's wrapper overhead; strict_mode
+        # keeps the same reject-invalid-input contract as validate=True.
+        # Anything that is not a 64-byte key is rejected here so callers
+        # need no separate length check.
+        try:
+            decoded = binascii.a2b_base64(value, strict_mode=True)
+        except Exception:
+            return None
+        return decoded if len(decoded) == 64 else None
 
-def _extract_candidates(text: str) -> List[str]:
-    match = METHOD_RE.search(text)
-    segment = match.group(1) if match else text
-    candidates: List[str] = []
-    for match in STRING_RE.finditer(segment):
-        raw = match.group(1).strip()
-        if len(raw) < 20 or not BASE64_RE.match(raw):
-            continue
-        decoded = _decode_base64(raw)
-        if decoded is None:
-            continue
-        if len(decoded) == 64:
-            candidates.append(raw)
-    return candidates
+else:  # pragma: no cover - strict_mode needs Python 3.11
+
+    def _decode_base64(value: str) -> Optional[bytes]:
+        try:
+            decoded = base64.b64decode(value, validate=True)
+        except Exception:
+            return None
+        return decoded if len(decoded) == 64 else None
+
+
+def _extract_candidates(data: Union[bytes, str]) -> List[str]:
+    if isinstance(data, str):
+        data = data.encode("utf-8", errors="ignore")
+    match = METHOD_RE.search(data)
+    segment = match.group(1) if match else data
+    return _scan_candidates(segment)
 
 
 def _find_smali_files(root: Path) -> List[Path]:
-    return sorted(root.rglob("InstrumentRepository.smali"))
+    # Decoded APKs hold tens of thousands of entries; scandir walks them
+    # without building a Path per entry the way rglob does, and DirEntry
+    # answers is_dir from the readdir data instead of an extra stat.
+    out: List[Path] = []
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name == "InstrumentRepository.smali":
+                    out.append(Path(entry.path))
+    return sorted(out)
 
 
 def _decode_apk(apk_path: Path, apktool_jar: Path, output_dir: Path) -> Path:
@@ -117,29 +204,81 @@ def _decode_apk(apk_path: Path, apktool_jar: Path, output_dir: Path) -> Path:
         str(apktool_jar),
         "d",
         "-f",
+        # Only smali is consumed downstream; skipping resource and asset
+        # decoding cuts most of apktool's work per APK.
+        "--no-res",
+        "--no-assets",
         "-o",
         str(output_dir),
         str(apk_path),
     ]
-    subprocess.run(cmd, check=True)
+    try:
+        # Progress chatter otherwise floods the tty (and can block on a
+        # full pipe buffer); keep only stderr for error reporting.
+        subprocess.run(
+            cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+    except subprocess.CalledProcessError as exc:
+        detail = exc.stderr.decode(errors="replace") if exc.stderr else str(exc)
+        raise AuthKeyError(f"apktool failed for {apk_path}: {detail}") from exc
     return output_dir
 
 
+def _apk_digest(apk_path: Path) -> str:
+    if sys.version_info >= (3, 11):
+        with open(apk_path, "rb") as handle:
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+    digest = hashlib.sha256()
+    with open(apk_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _decode_apk_cached(apk_path: Path, apktool_jar: Path) -> Path:
+    # apktool launches a JVM and decodes the whole APK; keying the output
+    # directory on the APK's content hash lets repeat runs reuse a prior
+    # decode instead of paying that cost again.
+    out_dir = find_repo_root() / "temp" / f"apktool_{_apk_digest(apk_path)[:16]}"
+    if out_dir.exists() and _find_smali_files(out_dir):
+        return out_dir
+    return _decode_apk(apk_path, apktool_jar, out_dir)
+
+
+# Exact-name fast path plus substring hints, checked in priority order.
+_APK_SCORE = {"base.apk": 0}
+_APK_HINTS = ("com.vaonis", "barnard")
+
+
 def _score_apk(path: Path) -> int:
     name = path.name.lower()
+    score = _APK_SCORE.get(name)
+    if score is not None:
+        return score
     if "base" in name:
         return 0
-    if "com.vaonis" in name or "barnard" in name:
+    if any(hint in name for hint in _APK_HINTS):
         return 1
     return 2
 
 
+def _make_temp_dir(prefix: str) -> Path:
+    # mkdtemp is atomic (O_EXCL), so concurrent runs never collide the
+    # way second-resolution strftime stamps could.
+    base = find_repo_root() / "temp"
+    base.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(prefix=prefix, dir=str(base)))
+
+
 def _expand_zip(zip_path: Path) -> Path:
-    stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    out_dir = find_repo_root() / "temp" / f"zip_extract_{stamp}"
-    out_dir.mkdir(parents=True, exist_ok=True)
+    out_dir = _make_temp_dir("zip_extract_")
+    # Only smali sources and nested APKs are ever consumed downstream;
+    # skipping resources/assets keeps I/O and disk usage proportional to
+    # the interesting members instead of the whole archive.
     with zipfile.ZipFile(zip_path) as zf:
-        zf.extractall(out_dir)
+        for info in zf.infolist():
+            if info.filename.endswith((".smali", ".apk", ".xapk")):
+                zf.extract(info, out_dir)
     return out_dir
 
 
@@ -155,12 +294,7 @@ def _pick_candidates(root: Path) -> List[Path]:
     return candidates
 
 
-def _extract_key_from_smali(smali_paths: Iterable[Path]) -> ExtractedKey:
-    keys: dict[str, List[Path]] = {}
-    for path in smali_paths:
-        text = path.read_text(encoding="utf-8", errors="ignore")
-        for key in _extract_candidates(text):
-            keys.setdefault(key, []).append(path)
+def _resolve_single_key(keys: dict[str, List[Path]]) -> ExtractedKey:
     if not keys:
         raise AuthKeyNotFound("No 64-byte base64 key found.")
     if len(keys) > 1:
@@ -172,6 +306,90 @@ def _extract_key_from_smali(smali_paths: Iterable[Path]) -> ExtractedKey:
     return ExtractedKey(key=key, sources=sources)
 
 
+# Below this many files the fork/spawn overhead of a process pool costs
+# more than the serial scan it replaces.
+_PARALLEL_SCAN_THRESHOLD = 16
+
+
+def _scan_one(path: Path) -> List[str]:
+    """Scan a single smali file; module-level so worker processes can pickle it.
+
+    The file is memory-mapped so the byte regexes run over the page cache
+    without copying the whole file into a Python bytes object first; empty
+    or unmappable files fall back to a plain read.
+    """
+    try:
+        with open(path, "rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                return _extract_candidates(view)
+    except (OSError, ValueError):
+        return _extract_candidates(path.read_bytes())
+
+
+def _extract_key_from_smali(smali_paths: Iterable[Path]) -> ExtractedKey:
+    paths = list(smali_paths)
+    keys: dict[str, List[Path]] = {}
+    if len(paths) > _PARALLEL_SCAN_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_scan_one, paths, chunksize=32)
+            for path, candidates in zip(paths, results):
+                for key in candidates:
+                    keys.setdefault(key, []).append(path)
+    else:
+        for path in paths:
+            for key in _scan_one(path):
+                keys.setdefault(key, []).append(path)
+    return _resolve_single_key(keys)
+
+
+# Chunk size for streaming archive members; the overlap carried between
+# chunks must cover the longest quoted candidate (88 chars + quotes).
+_ZIP_CHUNK_SIZE = 64 * 1024
+_ZIP_CHUNK_OVERLAP = 128
+
+
+def _scan_stream(handle) -> List[str]:
+    """Scan a binary file object chunk by chunk, bounding peak memory."""
+    candidates: List[str] = []
+    seen: set = set()
+    tail = b""
+    while True:
+        chunk = handle.read(_ZIP_CHUNK_SIZE)
+        if not chunk:
+            break
+        buf = tail + chunk
+        for key in _scan_candidates(buf):
+            # The overlap window can surface the same hit twice.
+            if key not in seen:
+                seen.add(key)
+                candidates.append(key)
+        tail = buf[-_ZIP_CHUNK_OVERLAP:]
+    return candidates
+
+
+def _extract_key_from_zip(zip_path: Path) -> Optional[ExtractedKey]:
+    """Scan ``InstrumentRepository.smali`` members inside an archive.
+
+    Members are streamed in chunks rather than materialized whole, so peak
+    memory stays at O(chunk size) even for multi-hundred-MB APKs. Only the
+    file the extraction path also targets is scanned — base64-looking
+    literals elsewhere must not trip the multiple-keys check. Returns
+    None when the archive holds no such entries or no candidate keys, so
+    callers can fall back to full expansion (e.g. nested APKs).
+    """
+    keys: dict[str, List[Path]] = {}
+    with zipfile.ZipFile(zip_path) as zf:
+        for name in zf.namelist():
+            if not name.endswith("InstrumentRepository.smali"):
+                continue
+            with zf.open(name) as handle:
+                for key in _scan_stream(handle):
+                    keys.setdefault(key, []).append(Path(name))
+    if not keys:
+        return None
+    return _resolve_single_key(keys)
+
+
 def _prompt_for_path(prompt: Callable[[str], str]) -> Path:
     raw = prompt("Enter path to Barnard APK/XAPK/ZIP or decoded folder: ").strip()
     if not raw:
@@ -219,6 +437,11 @@ def ensure_auth_key(
     else:
         suffix = resolved_input.suffix.lower()
         if suffix in (".zip", ".xapk"):
+            extracted = _extract_key_from_zip(resolved_input)
+            if extracted is not None:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_path.write_text(f"{extracted.key}\n", encoding="utf-8")
+                return output_path
             search_root = _expand_zip(resolved_input)
         elif suffix == ".apk":
             search_root = resolved_input
@@ -235,9 +458,7 @@ def ensure_auth_key(
         jar = _normalize_safe_path(jar)
         if not jar.exists():
             raise AuthKeyError(f"apktool jar not found: {jar}")
-        stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        out_dir = find_repo_root() / "temp" / f"apktool_{stamp}"
-        search_root = _decode_apk(search_root, jar, out_dir)
+        search_root = _decode_apk_cached(search_root, jar)
 
     smali_paths = _find_smali_files(search_root)
     if not smali_paths and search_root.is_dir():
@@ -251,9 +472,7 @@ def ensure_auth_key(
             jar = _normalize_safe_path(jar)
             if not jar.exists():
                 raise AuthKeyError(f"apktool jar not found: {jar}")
-            stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            out_dir = find_repo_root() / "temp" / f"apktool_{stamp}"
-            decoded = _decode_apk(apk_path, jar, out_dir)
+            decoded = _decode_apk_cached(apk_path, jar)
             smali_paths = _find_smali_files(decoded)
             if smali_paths:
                 break
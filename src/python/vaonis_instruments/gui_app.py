@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import bisect
+import concurrent.futures
+import copy
+import hashlib
 import io
 import json
 import logging
+import logging.handlers
+from collections import defaultdict, deque, namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
 import queue
 import re
 import signal
-import threading
+import sys
 import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from pathlib import Path
 
@@ -26,86 +35,384 @@ except Exception:
 
 from .auth import AuthContext, build_authorization_header
 from .auth_key_extractor import ensure_auth_key
-from .logging_utils import find_repo_root, setup_logging
+from ._json import dumps_pretty, loads as _fast_json_loads
+from .logging_utils import _LOG_FORMATTER, find_repo_root, setup_logging
 from .socket_client import VaonisSocketClient
 from .unified_client import DEFAULT_PREFIXES, UnifiedHTTPClient
 
 TIME_SYNC_THRESHOLD_MS = 5000
 TIME_SYNC_COOLDOWN_SEC = 60
 
+# Suffix appended to over-long rendered values; precomputed once so the hot
+# stringify path does a single slice + concat.
+_TRUNC_SUFFIX = "... (truncated)"
 
+
+@dataclass(frozen=True)
+class _StatusSnapshot:
+    """Fields the GUI needs from a status payload, pulled in one pass.
+
+    Built once per status event so the downstream checks read attributes
+    instead of each re-walking the nested result dict.
+    """
+
+    telescope_id: Optional[str] = None
+    boot_count: Optional[int] = None
+    timestamp: Any = None
+    preview_url: Optional[str] = None
+    operation_state: Optional[str] = None
+
+    @classmethod
+    def from_payload(cls, status: Any) -> "_StatusSnapshot":
+        if not isinstance(status, dict):
+            return cls()
+        result = status.get("result")
+        if not isinstance(result, dict):
+            return cls(timestamp=status.get("timestamp"))
+        operation_state: Optional[str] = None
+        current = result.get("currentOperation")
+        if isinstance(current, dict):
+            state = current.get("state")
+            if isinstance(state, str):
+                operation_state = state
+        timestamp = status.get("timestamp")
+        if timestamp is None:
+            timestamp = result.get("timestamp")
+        return cls(
+            telescope_id=result.get("telescopeId"),
+            boot_count=result.get("bootCount"),
+            timestamp=timestamp,
+            preview_url=result.get("previewUrl"),
+            operation_state=operation_state,
+        )
+
+
+@lru_cache(maxsize=16)
 def _safe_json_load(text: str) -> Any:
+    # Params fields are re-validated on every send; identical text (the
+    # common case) parses once.
     raw = text.strip()
     if not raw:
         return None
     return json.loads(raw)
 
 
+# Identity cache for the most recent render: live-view refreshes hand the
+# same parsed object back repeatedly. Holding the value reference pins its
+# id() so the key cannot be recycled.
+_FORMAT_CACHE: List[Any] = [None, ""]
+
+
 def _format_json(value: Any) -> str:
+    if _FORMAT_CACHE[0] is value and value is not None:
+        return _FORMAT_CACHE[1]
     try:
-        return json.dumps(value, indent=2, sort_keys=True, ensure_ascii=True)
+        # dumps_pretty rides orjson when the speedups extra is installed,
+        # which restores sorted keys at a fraction of the stdlib cost.
+        rendered = dumps_pretty(value)
     except TypeError:
         return str(value)
+    _FORMAT_CACHE[0] = value
+    _FORMAT_CACHE[1] = rendered
+    return rendered
+
+
+# One entry per status row: tree item id plus last shown value, so a
+# refresh touches a single hash table instead of twin dicts.
+_StatusField = namedtuple("_StatusField", ("tree_iid", "value"))
+
+
+class _RouteInfo:
+    """Per-route lookup record: bundle entry, request schema, query params.
+
+    Slotted so the route table is one flat dict of small fixed-shape
+    objects instead of three parallel dicts probed separately.
+    """
+
+    __slots__ = ("bundle", "request_schema", "query_params")
+
+    def __init__(
+        self,
+        bundle: Optional[Dict[str, Any]] = None,
+        request_schema: Optional[Union[Path, Dict[str, Any], str]] = None,
+        query_params: Optional[List[str]] = None,
+    ) -> None:
+        self.bundle = bundle
+        self.request_schema = request_schema
+        self.query_params = query_params
+
+
+def _normalize_route_key(method: str, path: str) -> str:
+    # Interned single-string keys: one hash over one (shared) object per
+    # probe instead of tuple hashing two strings.
+    return sys.intern(f"{method.upper()} /{path.lstrip('/')}")
+
+
+@lru_cache(maxsize=1)
+def _load_route_catalog() -> Dict[str, Dict[str, Any]]:
+    # The catalog never changes within a run; caching at module level
+    # means a second window (or a reload) skips the read and parse. Lazy
+    # on first use rather than at import so importing the module for its
+    # helpers stays cheap.
+    routes_path = Path(__file__).resolve().parent / "data" / "http_routes_union.json"
+    routes_list = _fast_json_loads(routes_path.read_bytes())
+    return {item["operationId"]: item for item in routes_list}
+
+
+@lru_cache(maxsize=256)
+def _load_schema_cached(path_str: str) -> Dict[str, Any]:
+    # String keys hash in one shot where Path objects re-hash their
+    # parts; module scope shares parsed schemas across app instances.
+    return _fast_json_loads(Path(path_str).read_bytes())
+
+
+@lru_cache(maxsize=4)
+def _load_bundle_cached(path_str: str, mtime: float) -> Any:
+    # mtime in the key: a touched bundle reloads, an unchanged one costs
+    # a stat instead of megabytes of re-parse.
+    return _fast_json_loads(Path(path_str).read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _load_route_table() -> Tuple[Dict[str, _RouteInfo], Dict[str, Dict[str, Any]]]:
+    """Build the flat per-route lookup table plus the by-name schema map.
+
+    Each route's bundle entry, request schema and query params live in one
+    `_RouteInfo` record, so resolving a route at selection time is a
+    single dict probe. Cached per process; treat the result as read-only.
+    """
+    base_path = Path(__file__).resolve().parents[2]
+    bundle_path = base_path / "unified" / "schemas" / "schema_bundle.json"
+    bundle_by_name: Dict[str, Dict[str, Any]] = {}
+    routes: Dict[str, _RouteInfo] = {}
+    if bundle_path.exists():
+        bundle = _load_bundle_cached(str(bundle_path), bundle_path.stat().st_mtime)
+        http_bundle = bundle.get("http") or {}
+        schemas_by_name = http_bundle.get("schemasByName") or http_bundle.get("byName")
+        if isinstance(schemas_by_name, dict):
+            bundle_by_name = {
+                name: schema
+                for name, schema in schemas_by_name.items()
+                if isinstance(schema, dict)
+            }
+        raw_routes = http_bundle.get("routes") or http_bundle.get("byRoute") or {}
+        for route_key, route_entry in raw_routes.items():
+            if not isinstance(route_key, str):
+                continue
+            if isinstance(route_entry, str):
+                route_entry = {"request": route_entry}
+            if not isinstance(route_entry, dict):
+                continue
+            method, _, path = route_key.partition(" ")
+            if not method or not path:
+                continue
+            info = _RouteInfo(bundle=route_entry)
+            request_name = route_entry.get("request")
+            if isinstance(request_name, (dict, str)):
+                # A str is a byName reference; resolution waits until the
+                # operation is actually selected.
+                info.request_schema = request_name
+            params = route_entry.get("queryParams")
+            if isinstance(params, list):
+                cleaned = [
+                    name for name in params if isinstance(name, str) and name.strip()
+                ]
+                if cleaned:
+                    info.query_params = cleaned
+            routes[_normalize_route_key(method, path)] = info
+        return routes, bundle_by_name
+
+    endpoints_path = base_path / "unified" / "data" / "api_full" / "http_endpoints.json"
+    schemas_root = base_path / "unified" / "schemas" / "http"
+    if endpoints_path.exists() and schemas_root.exists():
+        endpoints = _fast_json_loads(endpoints_path.read_bytes())
+        for endpoint in endpoints:
+            method = str(endpoint.get("method", "")).upper()
+            path = str(endpoint.get("path", ""))
+            ref = endpoint.get("requestBodyRef")
+            if not method or not path or not ref:
+                continue
+            body_name = str(ref).split("/")[-1]
+            # No exists() probe here: startup skips one stat per route and
+            # missing files surface as a lazy miss on first selection.
+            schema_path = schemas_root / f"{body_name}.json"
+            key = _normalize_route_key(method, path)
+            routes.setdefault(key, _RouteInfo()).request_schema = schema_path
+
+    params_path = (
+        base_path / "unified" / "data" / "api_extracted" / "stellina_api_endpoints.json"
+    )
+    if not params_path.exists():
+        return routes, bundle_by_name
+    endpoints = _fast_json_loads(params_path.read_bytes())
+    for endpoint in endpoints:
+        method = str(endpoint.get("http_method", "")).upper()
+        path = str(endpoint.get("path", ""))
+        if not method or not path:
+            continue
+        params: List[str] = []
+        for param in endpoint.get("params", []) or []:
+            for annotation in param.get("annotations", []) or []:
+                if str(annotation.get("kind", "")).lower() != "query":
+                    continue
+                elements = annotation.get("elements") or {}
+                name = elements.get("value")
+                if isinstance(name, str) and name:
+                    params.append(name)
+        if not params:
+            continue
+        info = routes.setdefault(_normalize_route_key(method, path), _RouteInfo())
+        if info.query_params:
+            existing = set(info.query_params)
+            info.query_params.extend(name for name in params if name not in existing)
+        else:
+            info.query_params = params
+    return routes, bundle_by_name
 
 
 def _looks_like_url(value: str) -> bool:
-    return value.startswith("http://") or value.startswith("https://")
+    return value.startswith(("http://", "https://"))
+
+
+# Content-type tokens checked in priority order.
+_CT_EXTENSIONS = (
+    ("png", ".png"),
+    ("jpeg", ".jpg"),
+    ("jpg", ".jpg"),
+    ("gif", ".gif"),
+    ("bmp", ".bmp"),
+    ("tiff", ".tiff"),
+    ("webp", ".webp"),
+)
+
+# (((offset, signature), ...), extension) checked in order against a
+# memoryview so each probe is one C-level compare without slice
+# allocations. WEBP needs both parts: the RIFF container prefix and the
+# WEBP chunk tag at offset 8.
+_MAGIC = (
+    (((0, b"\xff\xd8\xff"),), ".jpg"),
+    (((0, b"\x89PNG\r\n\x1a\n"),), ".png"),
+    (((0, b"GIF87a"),), ".gif"),
+    (((0, b"GIF89a"),), ".gif"),
+    (((0, b"BM"),), ".bmp"),
+    (((0, b"II*\x00"),), ".tiff"),
+    (((0, b"MM\x00*"),), ".tiff"),
+    (((0, b"RIFF"), (8, b"WEBP")), ".webp"),
+)
+
+
+@lru_cache(maxsize=32)
+def _ct_to_ext(content_type: Optional[str]) -> Optional[str]:
+    # Live view hits this per frame with the same handful of content
+    # types; cache on the raw header string so repeats skip the lower()
+    # and substring scans entirely.
+    if not content_type:
+        return None
+    ct = content_type.lower()
+    for token, ext in _CT_EXTENSIONS:
+        if token in ct:
+            return ext
+    return None
 
 
 def _image_extension(data: bytes, content_type: Optional[str]) -> str:
-    if content_type:
-        ct = content_type.lower()
-        if "png" in ct:
-            return ".png"
-        if "jpeg" in ct or "jpg" in ct:
-            return ".jpg"
-        if "gif" in ct:
-            return ".gif"
-        if "bmp" in ct:
-            return ".bmp"
-        if "tiff" in ct:
-            return ".tiff"
-        if "webp" in ct:
-            return ".webp"
-    if data[:3] == b"\xff\xd8\xff":
-        return ".jpg"
-    if data[:8] == b"\x89PNG\r\n\x1a\n":
-        return ".png"
-    if data[:6] in (b"GIF87a", b"GIF89a"):
-        return ".gif"
-    if data[:2] == b"BM":
-        return ".bmp"
-    if data[:4] in (b"II*\x00", b"MM\x00*"):
-        return ".tiff"
-    if len(data) >= 12 and data[:4] == b"RIFF" and data[8:12] == b"WEBP":
-        return ".webp"
+    ext = _ct_to_ext(content_type)
+    if ext is not None:
+        return ext
+    view = memoryview(data)
+    for parts, ext in _MAGIC:
+        if all(
+            len(data) >= offset + len(signature)
+            and view[offset : offset + len(signature)] == signature
+            for offset, signature in parts
+        ):
+            return ext
     return ".bin"
 
 
+_IMAGE_KEY_TOKENS = ("image", "preview", "thumbnail")
+
+# Operation states that should not keep the live view running.
+_IDLE_STATE_TOKENS = ("idle", "none", "stopped", "finished", "complete", "done")
+
+
+def _ts_from_number(value: Any) -> Optional[int]:
+    numeric = float(value)
+    if numeric <= 0:
+        return None
+    if numeric < 1e11:
+        return int(numeric * 1000)  # seconds -> milliseconds
+    return int(numeric)
+
+
+def _ts_from_str(value: str) -> Optional[int]:
+    stripped = value.strip()
+    if not stripped:
+        return None
+    try:
+        numeric = float(stripped)
+    except ValueError:
+        return None
+    return _ts_from_number(numeric)
+
+
+def _ts_unsupported(_value: Any) -> Optional[int]:
+    return None
+
+
+# Exact-type dispatch: called on every status tick, and type(True) is bool,
+# so booleans fall through to the unsupported handler as before.
+_TS_NORMALIZERS: Dict[type, Callable[[Any], Optional[int]]] = {
+    int: _ts_from_number,
+    float: _ts_from_number,
+    str: _ts_from_str,
+}
+
+
 def _find_image_urls(payload: Any) -> List[str]:
     urls: List[str] = []
-
-    def walk(value: Any) -> None:
+    # Explicit stack instead of recursion: deep status payloads stay clear
+    # of the recursion limit and skip per-level frame setup.
+    stack: List[Any] = [payload]
+    while stack:
+        value = stack.pop()
         if isinstance(value, dict):
             for key, val in value.items():
-                if isinstance(val, str) and (
-                    "image" in key.lower()
-                    or "preview" in key.lower()
-                    or "thumbnail" in key.lower()
-                ):
-                    urls.append(val)
-                else:
-                    walk(val)
+                if isinstance(val, str):
+                    lowered = key.lower()
+                    if any(token in lowered for token in _IMAGE_KEY_TOKENS):
+                        urls.append(val)
+                elif isinstance(val, (dict, list)):
+                    stack.append(val)
         elif isinstance(value, list):
-            for item in value:
-                walk(item)
-
-    walk(payload)
-    return [u for u in urls if isinstance(u, str)]
-
-
-class QueueLogHandler(logging.Handler):
-    def __init__(self, log_queue: "queue.Queue[str]") -> None:
+            stack.extend(value)
+    return urls
+
+
+# Single alternation for response highlighting: group names double as the
+# Text tag names. A quoted token followed by ':' is a key; the string
+# branch shields embedded digits and literals from the later branches.
+# One scan classifies a log line's level for console tagging.
+_LEVEL_RE = re.compile(r" (ERROR|EXCEPTION|WARNING|INFO) ")
+_LEVEL_TAG = {
+    "ERROR": "log_error",
+    "EXCEPTION": "log_error",
+    "WARNING": "log_warning",
+    "INFO": "log_info",
+}
+
+_JSON_TAG_RE = re.compile(
+    r'(?P<json_key>"[^"\\\n]*(?:\\.[^"\\\n]*)*")(?=\s*:)'
+    r'|(?P<json_string>"[^"\\\n]*(?:\\.[^"\\\n]*)*")'
+    r"|(?P<json_number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)"
+    r"|(?P<json_bool>\b(?:true|false|null)\b)"
+)
+
+
+class _FormatterHandler(logging.Handler):
+    """Formats records on the listener thread and feeds the Tk pump deque."""
+
+    def __init__(self, log_queue: "deque[str]") -> None:
         super().__init__()
         self.log_queue = log_queue
 
@@ -114,69 +421,90 @@ class QueueLogHandler(logging.Handler):
             msg = self.format(record)
         except Exception:
             msg = record.getMessage()
-        self.log_queue.put(msg)
+        self.log_queue.append(msg)
+
+
+# Fade ramp shared by fade-in (forward) and fade-out (reversed).
+_ALPHAS = (0.0, 1 / 6, 2 / 6, 3 / 6, 4 / 6, 5 / 6, 1.0)
+
+
+class TooltipManager:
+    """One tooltip shared by every widget carrying the "Tooltip" bindtag.
 
+    A single set of bind_class bindings serves all tooltips, so wiring a
+    widget costs one attribute and a bindtags tweak instead of three Tcl
+    command registrations per widget.
+    """
 
-class ToolTip:
     def __init__(
         self,
-        widget: tk.Widget,
-        text: str,
+        root: tk.Tk,
         *,
         delay_ms: int = 750,
         background: str = "SystemInfoBackground",
         foreground: str = "SystemInfoText",
         wrap_length: int = 360,
     ) -> None:
-        self.widget = widget
-        self.text = text
+        self.root = root
         self.delay_ms = delay_ms
         self.background = background
         self.foreground = foreground
         self.wrap_length = wrap_length
+        # Weak keys: destroyed widgets drop their tooltip text without
+        # the manager holding them (or per-widget attributes) alive.
+        self._texts: "WeakKeyDictionary[tk.Widget, str]" = WeakKeyDictionary()
+        self._widget: Optional[tk.Widget] = None
         self._after_id: Optional[str] = None
         self._tip_window: Optional[tk.Toplevel] = None
+        self._tip_label: Optional[tk.Label] = None
+        self._visible = False
         self._fade_after_id: Optional[str] = None
+        self._fade_step = 0
+
+        root.bind_class("Tooltip", "<Enter>", self._on_enter, add="+")
+        root.bind_class("Tooltip", "<Leave>", self._on_leave, add="+")
+        root.bind_class("Tooltip", "<ButtonPress>", self._on_leave, add="+")
 
-        widget.bind("<Enter>", self._on_enter)
-        widget.bind("<Leave>", self._on_leave)
-        widget.bind("<ButtonPress>", self._on_leave)
+    def attach(self, widget: tk.Widget, text: str) -> None:
+        self._texts[widget] = text
+        widget.bindtags(widget.bindtags() + ("Tooltip",))
 
-    def _on_enter(self, *_: Any) -> None:
+    def _on_enter(self, event: "tk.Event[tk.Widget]") -> None:
+        self._widget = event.widget
         self._schedule()
 
     def _on_leave(self, *_: Any) -> None:
         self._cancel()
+        self._fade_step = 0
         self._fade_out()
 
     def _schedule(self) -> None:
         self._cancel()
-        self._after_id = self.widget.after(self.delay_ms, self._show)
+        self._after_id = self.root.after(self.delay_ms, self._show)
 
     def _cancel(self) -> None:
         if self._after_id is not None:
             try:
-                self.widget.after_cancel(self._after_id)
+                self.root.after_cancel(self._after_id)
             except Exception:
                 pass
             self._after_id = None
 
-    def _show(self) -> None:
-        if self._tip_window is not None or not self.text:
-            return
-        tip = tk.Toplevel(self.widget)
+    def _ensure_window(self) -> tk.Toplevel:
+        # One persistent, withdrawn Toplevel per app: Toplevel creation
+        # is among the heaviest Tk operations, so hovers only retext and
+        # reposition it.
+        if self._tip_window is not None:
+            return self._tip_window
+        tip = tk.Toplevel(self.root)
         tip.wm_overrideredirect(True)
+        tip.withdraw()
         try:
             tip.wm_attributes("-topmost", True)
         except Exception:
             pass
-        try:
-            tip.wm_attributes("-alpha", 0.0)
-        except Exception:
-            pass
-        label = tk.Label(
+        self._tip_label = tk.Label(
             tip,
-            text=self.text,
             justify="left",
             background=self.background,
             foreground=self.foreground,
@@ -186,15 +514,30 @@ class ToolTip:
             padx=8,
             pady=4,
         )
-        label.pack()
+        self._tip_label.pack()
+        self._tip_window = tip
+        return tip
+
+    def _show(self) -> None:
+        widget = self._widget
+        text = self._texts.get(widget, "") if widget is not None else ""
+        if self._visible or not text or widget is None:
+            return
+        tip = self._ensure_window()
+        try:
+            tip.wm_attributes("-alpha", 0.0)
+        except Exception:
+            pass
+        assert self._tip_label is not None
+        self._tip_label.configure(text=text)
         tip.update_idletasks()
         tip_w = tip.winfo_width()
         tip_h = tip.winfo_height()
         screen_w = tip.winfo_screenwidth()
         screen_h = tip.winfo_screenheight()
-        widget_x = self.widget.winfo_rootx()
-        widget_y = self.widget.winfo_rooty()
-        widget_h = self.widget.winfo_height()
+        widget_x = widget.winfo_rootx()
+        widget_y = widget.winfo_rooty()
+        widget_h = widget.winfo_height()
         x = widget_x + 16
         y = widget_y + widget_h + 12
         if y + tip_h > screen_h - 8:
@@ -204,44 +547,51 @@ class ToolTip:
         if x + tip_w > screen_w - 8:
             x = max(8, screen_w - tip_w - 8)
         tip.wm_geometry(f"+{x}+{y}")
-        self._tip_window = tip
+        tip.deiconify()
+        self._visible = True
+        self._fade_step = 0
         self._fade_in()
 
     def _hide(self) -> None:
         if self._fade_after_id is not None:
             try:
-                self.widget.after_cancel(self._fade_after_id)
+                self.root.after_cancel(self._fade_after_id)
             except Exception:
                 pass
             self._fade_after_id = None
-        if self._tip_window is not None:
-            self._tip_window.destroy()
-            self._tip_window = None
+        if self._visible and self._tip_window is not None:
+            try:
+                self._tip_window.withdraw()
+            except Exception:
+                pass
+        self._visible = False
 
-    def _fade_in(self, step: int = 0) -> None:
-        if self._tip_window is None:
+    def _fade_in(self) -> None:
+        # Bound methods reschedule themselves against the precomputed
+        # alpha table; no lambda allocation per 15 ms tick.
+        if not self._visible or self._tip_window is None:
             return
         try:
-            alpha = min(1.0, step / 6)
+            alpha = _ALPHAS[min(self._fade_step, len(_ALPHAS) - 1)]
             self._tip_window.wm_attributes("-alpha", alpha)
         except Exception:
             return
         if alpha < 1.0:
-            self._fade_after_id = self.widget.after(15, lambda: self._fade_in(step + 1))
+            self._fade_step += 1
+            self._fade_after_id = self.root.after(15, self._fade_in)
 
-    def _fade_out(self, step: int = 0) -> None:
-        if self._tip_window is None:
+    def _fade_out(self) -> None:
+        if not self._visible or self._tip_window is None:
             return
         try:
-            alpha = max(0.0, 1.0 - (step / 6))
+            alpha = _ALPHAS[max(len(_ALPHAS) - 1 - self._fade_step, 0)]
             self._tip_window.wm_attributes("-alpha", alpha)
         except Exception:
             self._hide()
             return
         if alpha > 0.0:
-            self._fade_after_id = self.widget.after(
-                15, lambda: self._fade_out(step + 1)
-            )
+            self._fade_step += 1
+            self._fade_after_id = self.root.after(15, self._fade_out)
         else:
             self._hide()
 
@@ -253,37 +603,66 @@ class BarnardControlApp:
         self.root.geometry("900x770")
 
         self._theme = self._apply_theme()
+        self._text_config: Optional[Dict[str, str]] = None
+        self._tooltips: Optional[TooltipManager] = None
 
-        self.log_queue: "queue.Queue[str]" = queue.Queue()
+        # Bounded lock-free buffer: deque append/popleft are atomic in
+        # CPython, and maxlen caps memory if a burst outruns the pump
+        # (oldest lines drop first).
+        self.log_queue: "deque[str]" = deque(maxlen=10000)
         self.http_log = setup_logging("http")
         self.socket_log = setup_logging("socket")
         self.gui_log = setup_logging("gui")
 
-        self.log_handler = QueueLogHandler(self.log_queue)
-        self.log_handler.setFormatter(
-            logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
-        )
+        # Producers only enqueue raw LogRecords; formatting happens on the
+        # listener thread so noisy socket traffic never stalls its emitter
+        # (or the Tk main loop) on %-formatting and asctime work.
+        self._record_queue: "queue.SimpleQueue[logging.LogRecord]" = (
+            queue.SimpleQueue()
+        )
+        self.log_handler = logging.handlers.QueueHandler(self._record_queue)
+        # Same shared formatter the per-channel file handlers use; kept on
+        # the app so any future handler reuses it instead of minting one.
+        self._log_formatter = _LOG_FORMATTER
+        formatter_handler = _FormatterHandler(self.log_queue)
+        formatter_handler.setFormatter(self._log_formatter)
+        self._log_listener = logging.handlers.QueueListener(
+            self._record_queue, formatter_handler
+        )
+        self._log_listener.start()
         self.http_log.logger.addHandler(self.log_handler)
         self.socket_log.logger.addHandler(self.log_handler)
         self.gui_log.logger.addHandler(self.log_handler)
+        # Cached level check for hot paths; refreshed if the level changes.
+        # Call sites use lazy %-style args so disabled levels cost one
+        # boolean test, never string formatting.
+        self._gui_debug_enabled = self.gui_log.logger.isEnabledFor(logging.DEBUG)
 
         self.auth_header: Optional[str] = None
         self.auth_key_path: Optional[str] = None
         self.last_status: Optional[Dict[str, Any]] = None
+        self._status_snapshot: Optional[_StatusSnapshot] = None
+        # Virtualized response view: None means the whole payload fits in
+        # the Text widget; otherwise the full line buffer lives here and
+        # only a window around _response_top is rendered.
+        self._response_lines: Optional[List[str]] = None
+        self._response_top = 0
         self.last_image_bytes: Optional[bytes] = None
         self.last_image_content_type: Optional[str] = None
+        self._image_tk: Optional[Any] = None
+        self._last_image_hash: Optional[bytes] = None
         self.live_view_running = False
+        self._live_after_id: Optional[str] = None
+        self._live_in_flight = False
+        self._request_counts_after_id: Optional[str] = None
         self.socket_client: Optional[VaonisSocketClient] = None
         self._notebook: Optional[ttk.Notebook] = None
-        self.status_items: Dict[str, str] = {}
-        self.status_values: Dict[str, str] = {}
-        self._schema_cache: Dict[Path, Dict[str, Any]] = {}
+        self.status_fields: Dict[str, _StatusField] = {}
         self._schema_bundle_by_name: Dict[str, Dict[str, Any]] = {}
-        self._schema_bundle_routes: Dict[Tuple[str, str], Dict[str, Any]] = {}
-        self._request_schema_by_route: Dict[
-            Tuple[str, str], Union[Path, Dict[str, Any]]
+        self._routes: Dict[str, _RouteInfo] = {}
+        self._schema_example_cache: Dict[
+            Tuple[int, int, Optional[Path]], Tuple[Dict[str, Any], Any]
         ] = {}
-        self._query_params_by_route: Dict[Tuple[str, str], List[str]] = {}
         self._operation_groups: Dict[str, List[str]] = {}
         self._debug_operation_groups: Dict[str, List[str]] = {}
         self._operation_items: List[str] = []
@@ -291,10 +670,15 @@ class BarnardControlApp:
         self._operation_group_labels: Dict[str, str] = {}
         self._debug_group_labels: Dict[str, str] = {}
         self._group_label_width = 32
-        self.time_sync_notice_var = tk.StringVar(value="")
         self.time_sync_notice_label: Optional[ttk.Label] = None
         self._last_time_sync_at: Optional[float] = None
         self._closing = False
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="gui-io"
+        )
+        self._built_tabs: set = set()
+        self._tab_builders: Dict[str, str] = {}
+        self._console_lines = 0
 
         self._build_ui()
         self._register_exit_handlers()
@@ -328,40 +712,60 @@ class BarnardControlApp:
                 self.socket_client.disconnect()
             except Exception as exc:
                 self.gui_log.logger.warning("Socket disconnect failed: %s", exc)
+        try:
+            self._log_listener.stop()
+        except Exception:
+            pass
+        self._executor.shutdown(wait=False, cancel_futures=True)
         try:
             self.root.quit()
         finally:
             self.root.destroy()
 
     def _add_tooltip(self, widget: tk.Widget, text: str) -> None:
-        if self._theme is None:
-            ToolTip(widget, text)
-            return
-        ToolTip(
-            widget,
-            text,
-            background=self._theme["panel"],
-            foreground=self._theme["text"],
-        )
+        if self._tooltips is None:
+            if self._theme is None:
+                self._tooltips = TooltipManager(self.root)
+            else:
+                self._tooltips = TooltipManager(
+                    self.root,
+                    background=self._theme["panel"],
+                    foreground=self._theme["text"],
+                )
+        self._tooltips.attach(widget, text)
+
+    # Chosen theme name, probed once per process; theme_use/configure
+    # still run per Tk interpreter since style state is not shared.
+    _THEME_NAME: Optional[str] = None
 
     def _apply_theme(self) -> Optional[Dict[str, str]]:
         """Apply a sane default ttk theme and a small amount of spacing polish."""
         style = ttk.Style(self.root)
 
-        windowing_system = self.root.tk.call("tk", "windowingsystem")
-        preferred = {
-            "win32": ("vista", "xpnative"),
-            "aqua": ("aqua",),
-            "x11": ("clam",),
-        }.get(windowing_system, ("clam",))
-
-        for candidate in (*preferred, "clam", "default"):
-            if candidate in style.theme_names():
+        if BarnardControlApp._THEME_NAME is not None:
+            try:
+                style.theme_use(BarnardControlApp._THEME_NAME)
+            except tk.TclError:
+                BarnardControlApp._THEME_NAME = None
+        if BarnardControlApp._THEME_NAME is None:
+            windowing_system = self.root.tk.call("tk", "windowingsystem")
+            preferred = {
+                "win32": ("vista", "xpnative"),
+                "aqua": ("aqua",),
+                "x11": ("clam",),
+            }.get(windowing_system, ("clam",))
+
+            # One theme_names round-trip; membership tests hit the set.
+            names = set(style.theme_names())
+            chosen = next(
+                (c for c in (*preferred, "clam", "default") if c in names), None
+            )
+            if chosen is not None:
                 try:
-                    style.theme_use(candidate)
-                    break
+                    style.theme_use(chosen)
+                    BarnardControlApp._THEME_NAME = chosen
                 except tk.TclError:
-                    continue
+                    pass
 
         style.configure("TNotebook.Tab", padding=(12, 6))
         style.configure("TLabelframe", padding=(10, 8))
@@ -378,20 +782,23 @@ class BarnardControlApp:
     def _style_text(self, widget: tk.Text) -> None:
         if self._theme is None:
             return
-        options = {
-            "background": self._theme["entry_bg"],
-            "foreground": self._theme["text"],
-            "insertbackground": self._theme["text"],
-            "selectbackground": self._theme["select_bg"],
-            "selectforeground": self._theme["text"],
-            "disabledbackground": self._theme["entry_bg"],
-            "disabledforeground": self._theme["text_dim"],
-        }
-        available = set(widget.keys())
-        safe_options = {
-            key: value for key, value in options.items() if key in available
-        }
-        widget.configure(**safe_options)
+        if self._text_config is None:
+            # Every tk.Text exposes the same option keys, so introspect the
+            # first widget styled and reuse the filtered config for the rest.
+            options = {
+                "background": self._theme["entry_bg"],
+                "foreground": self._theme["text"],
+                "insertbackground": self._theme["text"],
+                "selectbackground": self._theme["select_bg"],
+                "selectforeground": self._theme["text"],
+                "disabledbackground": self._theme["entry_bg"],
+                "disabledforeground": self._theme["text_dim"],
+            }
+            available = set(widget.keys())
+            self._text_config = {
+                key: value for key, value in options.items() if key in available
+            }
+        widget.configure(**self._text_config)
 
     def _build_ui(self) -> None:
         main_pane = ttk.PanedWindow(self.root, orient=tk.VERTICAL)
@@ -414,9 +821,6 @@ class BarnardControlApp:
 
         quick_font = ("TkDefaultFont", 9)
 
-        style = ttk.Style()
-        style.configure("Quick.TButton", anchor="w")
-
         step0_label = ttk.Label(
             quick_frame,
             text="Set Host/Port + API base path (instrument IP).",
@@ -528,17 +932,100 @@ class BarnardControlApp:
         self._notebook.add(self.http_tab, text="HTTP")
         self._notebook.add(self.socket_tab, text="Socket")
         self._notebook.add(self.image_tab, text="Images")
-        self._notebook.bind(
-            "<<NotebookTabChanged>>", lambda _e: self._render_status_card()
-        )
+        # Tabs other than Connection are populated lazily on first
+        # selection (or first widget access via __getattr__), so cold
+        # start only pays for the widgets actually shown.
+        self._tab_builders = {
+            str(self.status_tab): "_build_status_tab",
+            str(self.http_tab): "_build_http_tab",
+            str(self.socket_tab): "_build_socket_tab",
+            str(self.image_tab): "_build_image_tab",
+        }
+        self._notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         self._build_connection_tab()
-        self._build_status_tab()
-        self._build_http_tab()
-        self._build_socket_tab()
-        self._build_image_tab()
         self._build_console_tab(console_frame)
 
+    # Attributes created by each lazily-built tab; touching one before the
+    # tab has been opened builds that tab transparently.
+    _LAZY_TAB_ATTRS: Dict[str, str] = {
+        "status_tree": "_build_status_tab",
+        **{
+            name: "_build_http_tab"
+            for name in (
+                "operation_var",
+                "operation_combo",
+                "operation_group_var",
+                "operation_group_combo",
+                "operation_detail_var",
+                "debug_group_var",
+                "debug_group_combo",
+                "debug_operation_var",
+                "debug_operation_combo",
+                "params_text",
+                "body_text",
+                "params_pane",
+                "body_pane",
+                "request_split",
+                "response_text",
+                "_params_tab_title",
+                "_body_tab_title",
+            )
+        },
+        **{
+            name: "_build_socket_tab"
+            for name in (
+                "socket_url_var",
+                "socket_path_var",
+                "socket_device_var",
+                "socket_name_var",
+                "socket_country_var",
+                "socket_user_var",
+                "socket_command_var",
+                "socket_payload_text",
+                "time_sync_notice_var",
+            )
+        },
+        **{
+            name: "_build_image_tab"
+            for name in (
+                "image_url_var",
+                "auto_live_var",
+                "live_interval_var",
+                "image_label",
+            )
+        },
+    }
+
+    def __getattr__(self, name: str) -> Any:
+        builder_name = type(self)._LAZY_TAB_ATTRS.get(name)
+        if builder_name is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        self._ensure_tab_built(builder_name)
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def gui_debug(self, fmt: str, *args: Any) -> None:
+        if self._gui_debug_enabled:
+            self.gui_log.logger.debug(fmt, *args)
+
+    def _ensure_tab_built(self, builder_name: str) -> None:
+        if builder_name in self._built_tabs:
+            return
+        self._built_tabs.add(builder_name)
+        getattr(self, builder_name)()
+
+    def _on_tab_changed(self, _event: object = None) -> None:
+        if self._notebook is not None:
+            builder_name = self._tab_builders.get(self._notebook.select())
+            if builder_name:
+                self._ensure_tab_built(builder_name)
+        self._render_status_card()
+
     def _build_connection_tab(self) -> None:
         outer = ttk.Frame(self.connection_tab, padding=10)
         outer.pack(fill=tk.BOTH, expand=True)
@@ -865,14 +1352,24 @@ class BarnardControlApp:
         )
         self._style_text(self.response_text)
         response_scroll = ttk.Scrollbar(
-            response, orient="vertical", command=self.response_text.yview
+            response, orient="vertical", command=self._response_yview
         )
+        self._response_scroll = response_scroll
         response_hscroll = ttk.Scrollbar(
             response, orient="horizontal", command=self.response_text.xview
         )
         self.response_text.configure(
-            yscrollcommand=response_scroll.set, xscrollcommand=response_hscroll.set
-        )
+            yscrollcommand=self._on_response_yscroll,
+            xscrollcommand=response_hscroll.set,
+        )
+        # Wheel and keyboard scrolling would otherwise use the widget's
+        # internal yview, stranding everything past the virtualized
+        # render window; route them through the same paging path as the
+        # scrollbar.
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.response_text.bind(sequence, self._on_response_wheel)
+        for sequence in ("<Prior>", "<Next>", "<Up>", "<Down>"):
+            self.response_text.bind(sequence, self._on_response_key)
         self.response_text.grid(row=0, column=0, sticky="nsew")
         response_scroll.grid(row=0, column=1, sticky="ns")
         response_hscroll.grid(row=1, column=0, sticky="ew")
@@ -1043,6 +1540,9 @@ class BarnardControlApp:
         restart_button.grid(row=0, column=2, padx=(0, 10), pady=2)
         shutdown_button.grid(row=0, column=3, pady=2)
 
+        # Created here rather than in __init__: the Tcl variable (and its
+        # trace list) only exists once the label that reads it does.
+        self.time_sync_notice_var = tk.StringVar(value="")
         self.time_sync_notice_label = ttk.Label(
             commands, textvariable=self.time_sync_notice_var, style="Muted.TLabel"
         )
@@ -1244,31 +1744,55 @@ class BarnardControlApp:
         self.console_text.configure(state="normal")
         self.console_text.delete("1.0", tk.END)
         self.console_text.configure(state="disabled")
+        self._console_lines = 0
         self._update_console_scrollbar()
 
+    _LOG_PUMP_BATCH = 200
+    CONSOLE_MAX_LINES = 5000
+
     def _schedule_log_pump(self) -> None:
-        while True:
+        messages: List[str] = []
+        for _ in range(self._LOG_PUMP_BATCH):
             try:
-                message = self.log_queue.get_nowait()
-            except queue.Empty:
+                messages.append(self.log_queue.popleft())
+            except IndexError:
                 break
-            self._append_console(message)
-        self.root.after(200, self._schedule_log_pump)
+        if messages:
+            self._append_console_batch(messages)
+        self.root.after(50, self._schedule_log_pump)
 
     def _append_console(self, message: str) -> None:
+        self._append_console_batch([message])
+
+    def _append_console_batch(self, messages: List[str]) -> None:
+        # Classify in Python, then insert one contiguous same-tag run at a
+        # time with the (text, tags) form, so a burst of N records costs a
+        # handful of Tcl round-trips instead of three per record.
+        runs: List[Tuple[Optional[str], List[str]]] = []
+        for message in messages:
+            match = _LEVEL_RE.search(message)
+            tag = _LEVEL_TAG[match.group(1)] if match else None
+            if runs and runs[-1][0] == tag:
+                runs[-1][1].append(message)
+            else:
+                runs.append((tag, [message]))
         self.console_text.configure(state="normal")
-        line_start = self.console_text.index(tk.END)
-        self.console_text.insert(tk.END, message + "\n")
-        line_end = self.console_text.index(tk.END)
-        tag = None
-        if " ERROR " in message or " EXCEPTION " in message:
-            tag = "log_error"
-        elif " WARNING " in message:
-            tag = "log_warning"
-        elif " INFO " in message:
-            tag = "log_info"
-        if tag:
-            self.console_text.tag_add(tag, line_start, line_end)
+        for tag, run in runs:
+            text = "\n".join(run) + "\n"
+            if tag:
+                self.console_text.insert(tk.END, text, (tag,))
+            else:
+                self.console_text.insert(tk.END, text)
+        # Python-side line counter keeps the widget bounded without asking
+        # Tk for its line count; eviction rides the same state toggle so
+        # trimming adds no extra redraw.
+        self._console_lines += len(messages) + sum(
+            message.count("\n") for message in messages
+        )
+        if self._console_lines > self.CONSOLE_MAX_LINES:
+            excess = self._console_lines - self.CONSOLE_MAX_LINES
+            self.console_text.delete("1.0", f"{excess + 1}.0")
+            self._console_lines -= excess
         self.console_text.see(tk.END)
         self.console_text.configure(state="disabled")
         self._update_console_scrollbar()
@@ -1296,49 +1820,98 @@ class BarnardControlApp:
         self._toggle_console_scrollbar(first, last)
 
     def _run_in_thread(
-        self, action: Callable[[], Any], on_success: Callable[[Any], None]
+        self,
+        action: Callable[[], Any],
+        on_success: Callable[[Any], None],
+        on_complete: Optional[Callable[[], None]] = None,
     ) -> None:
-        def runner() -> None:
+        # Pooled workers instead of a fresh thread per click; the
+        # executor bounds concurrency, and callers that must not overlap
+        # themselves (the live view) gate with their own in-flight flag.
+        # ``on_complete`` fires on the Tk thread once the action settles,
+        # success or not.
+        future = self._executor.submit(action)
+
+        def dispatch(fut: "concurrent.futures.Future[Any]") -> None:
+            if self._closing:
+                return
             try:
-                result = action()
+                self.root.after(
+                    0, lambda: self._dispatch_result(fut, on_success, on_complete)
+                )
+            except tk.TclError:
+                pass
+
+        future.add_done_callback(dispatch)
+
+    def _dispatch_result(
+        self,
+        future: "concurrent.futures.Future[Any]",
+        on_success: Callable[[Any], None],
+        on_complete: Optional[Callable[[], None]] = None,
+    ) -> None:
+        try:
+            try:
+                result = future.result()
             except Exception as exc:
                 self.gui_log.logger.exception("Action failed: %s", exc)
-                self.root.after(0, lambda: messagebox.showerror("Error", str(exc)))
+                messagebox.showerror("Error", str(exc))
                 return
-            self.root.after(0, lambda: on_success(result))
-
-        threading.Thread(target=runner, daemon=True).start()
+            on_success(result)
+        finally:
+            if on_complete is not None:
+                on_complete()
 
     def _auto_load_auth_key(self) -> None:
-        key_path = Path(__file__).resolve().parents[1] / ".auth_key"
-        if key_path.exists() and key_path.read_text(encoding="utf-8").strip():
-            self.auth_key_path = str(key_path)
-            self.auth_key_var.set(str(key_path))
-            self.gui_log.logger.info("Auth key already present at %s", key_path)
-            self._set_load_key_state(loaded=True)
-            return
-
-        root = find_repo_root()
-        candidates: List[Path] = []
-        preferred = root / "com.vaonis.barnard.zip"
-        if preferred.exists():
-            candidates.append(preferred)
-        for ext in (".apk", ".xapk", ".zip"):
-            for path in root.glob(f"*{ext}"):
-                if path not in candidates:
-                    candidates.append(path)
-
-        input_path: Optional[Path] = candidates[0] if candidates else None
-        if input_path is None:
-            selected = filedialog.askopenfilename(
-                title="Select Barnard APK/XAPK/ZIP",
-                filetypes=[("APK or ZIP", "*.apk *.zip *.xapk"), ("All files", "*.*")],
-            )
-            if not selected:
-                self.gui_log.logger.info("Auth key load canceled by user.")
+        def discover() -> Tuple[str, Optional[Path]]:
+            # All the stat/read/scan work runs on a worker so cold start
+            # never blocks the Tk loop on filesystem syscalls.
+            key_path = Path(__file__).resolve().parents[1] / ".auth_key"
+            if key_path.exists() and key_path.read_text(encoding="utf-8").strip():
+                return "key", key_path
+            root = find_repo_root()
+            candidates: List[Path] = []
+            preferred = root / "com.vaonis.barnard.zip"
+            if preferred.exists():
+                candidates.append(preferred)
+            # One directory scan classifying suffixes instead of a glob
+            # pass (and directory walk) per extension.
+            by_ext: Dict[str, List[Path]] = {".apk": [], ".xapk": [], ".zip": []}
+            for path in root.iterdir():
+                bucket = by_ext.get(path.suffix)
+                if bucket is not None and path != preferred:
+                    bucket.append(path)
+            for ext in (".apk", ".xapk", ".zip"):
+                candidates.extend(sorted(by_ext[ext]))
+            return "archive", candidates[0] if candidates else None
+
+        def done(result: Tuple[str, Optional[Path]]) -> None:
+            kind, found = result
+            if kind == "key" and found is not None:
+                self.auth_key_path = str(found)
+                self.auth_key_var.set(str(found))
+                self.gui_log.logger.info("Auth key already present at %s", found)
+                self._set_load_key_state(loaded=True)
                 return
-            input_path = Path(selected)
+            input_path = found
+            if input_path is None:
+                # The file dialog must run on the Tk thread.
+                selected = filedialog.askopenfilename(
+                    title="Select Barnard APK/XAPK/ZIP",
+                    filetypes=[
+                        ("APK or ZIP", "*.apk *.zip *.xapk"),
+                        ("All files", "*.*"),
+                    ],
+                )
+                if not selected:
+                    self.gui_log.logger.info("Auth key load canceled by user.")
+                    return
+                input_path = Path(selected)
+            self._begin_key_extraction(input_path)
 
+        self._run_in_thread(discover, done)
+
+    def _begin_key_extraction(self, input_path: Path) -> None:
         self.auth_key_var.set("Extracting auth key...")
         self.gui_log.logger.info("Extracting auth key from %s", input_path)
 
@@ -1383,18 +1956,19 @@ class BarnardControlApp:
         return build_authorization_header(ctx)
 
     def _refresh_auth(self) -> None:
-        def action() -> str:
+        def action() -> Tuple[str, Any]:
             client = self._build_http_client()
             status = client.request("GET", "app/status")
-            self._update_status_cache(status)
             auth_header = self._build_auth_from_status(status)
             if not auth_header:
                 raise ValueError("Status response missing auth fields.")
-            return auth_header
+            return auth_header, status
 
-        def done(auth_header: str) -> None:
+        def done(result: Tuple[str, Any]) -> None:
+            auth_header, status = result
             self.auth_header = auth_header
             self.auth_header_var.set(auth_header)
+            self._ingest_status(status)
 
         self._run_in_thread(action, done)
 
@@ -1408,9 +1982,8 @@ class BarnardControlApp:
             return client.request("GET", "app/status")
 
         def done(result: Any) -> None:
-            self._update_status_cache(result)
+            self._ingest_status(result)
             self._set_response(result)
-            self._update_image_url_from_status(result)
 
         self._run_in_thread(action, done)
 
@@ -1418,7 +1991,6 @@ class BarnardControlApp:
         def action() -> Tuple[str, Any]:
             client = self._build_http_client()
             status = client.request("GET", "app/status")
-            self._update_status_cache(status)
             auth_header = self._build_auth_from_status(status)
             if not auth_header:
                 raise ValueError("Status response missing auth fields.")
@@ -1428,8 +2000,8 @@ class BarnardControlApp:
             auth_header, status = result
             self.auth_header = auth_header
             self.auth_header_var.set(auth_header)
+            self._ingest_status(status)
             self._set_response(status)
-            self._update_image_url_from_status(status)
 
         self._run_in_thread(action, done)
 
@@ -1444,29 +2016,31 @@ class BarnardControlApp:
         self._run_in_thread(action, done)
 
     def _load_operations(self) -> None:
-        routes_path = (
-            Path(__file__).resolve().parent / "data" / "http_routes_union.json"
-        )
-        routes_list = json.loads(routes_path.read_text(encoding="utf-8"))
-        routes = {item["operationId"]: item for item in routes_list}
-        self._request_schema_by_route = self._load_request_schema_by_route()
-        self._query_params_by_route = self._load_query_params_by_route()
+        routes = _load_route_catalog()
+        self._routes, self._schema_bundle_by_name = _load_route_table()
+        # Locals only inside the loop: LOAD_FAST instead of attribute and
+        # setdefault lookups per route, then assign back once.
         items: List[str] = []
         debug_items: List[str] = []
-        self._operation_lookup: Dict[str, Dict[str, Any]] = {}
-        self._operation_groups = {}
-        self._debug_operation_groups = {}
+        op_lookup: Dict[str, Dict[str, Any]] = {}
+        op_groups: "defaultdict[str, List[str]]" = defaultdict(list)
+        debug_groups: "defaultdict[str, List[str]]" = defaultdict(list)
+        route_group = self._route_group
+        is_debug = self._is_debug_operation
         for operation_id, route in sorted(routes.items()):
             label = f"{operation_id} ({route['method']} {route['path']})"
             path_value = str(route.get("path", ""))
-            group = self._route_group(path_value)
-            if self._is_debug_operation(operation_id, path_value):
+            group = route_group(path_value)
+            if is_debug(operation_id, path_value):
                 debug_items.append(label)
-                self._debug_operation_groups.setdefault(group, []).append(label)
+                debug_groups[group].append(label)
             else:
                 items.append(label)
-                self._operation_groups.setdefault(group, []).append(label)
-            self._operation_lookup[label] = route
+                op_groups[group].append(label)
+            op_lookup[label] = route
+        self._operation_lookup: Dict[str, Dict[str, Any]] = op_lookup
+        self._operation_groups = dict(op_groups)
+        self._debug_operation_groups = dict(debug_groups)
         self._operation_items = items
         self._debug_operation_items = debug_items
 
@@ -1522,6 +2096,19 @@ class BarnardControlApp:
         if not widget.edit_modified():
             return
         widget.edit_modified(False)
+        # Coalesce keystroke bursts: re-read both editors once per idle
+        # cycle instead of on every keypress.
+        if self._request_counts_after_id is not None:
+            try:
+                self.root.after_cancel(self._request_counts_after_id)
+            except tk.TclError:
+                pass
+        self._request_counts_after_id = self.root.after_idle(
+            self._refresh_request_tab_counts
+        )
+
+    def _refresh_request_tab_counts(self) -> None:
+        self._request_counts_after_id = None
         self._update_request_tab_counts()
 
     def _update_request_tab_counts(self) -> None:
@@ -1562,7 +2149,11 @@ class BarnardControlApp:
         self.body_text.delete("1.0", tk.END)
         self._update_request_tab_counts()
 
-    def _route_group(self, path: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _route_group(path: str) -> str:
+        # Route paths come from a fixed catalog, so the strip/split work
+        # runs once per distinct path across reloads and combo refreshes.
         trimmed = path.strip("/")
         if not trimmed:
             return "root"
@@ -1624,132 +2215,35 @@ class BarnardControlApp:
             self.operation_detail_var.set("")
             self._clear_operation_fields()
 
-    def _normalize_route_key(self, method: str, path: str) -> Tuple[str, str]:
-        normalized = "/" + path.lstrip("/")
-        return method.upper(), normalized
-
-    def _load_request_schema_by_route(
-        self,
-    ) -> Dict[Tuple[str, str], Union[Path, Dict[str, Any]]]:
-        base_path = Path(__file__).resolve().parents[2]
-        bundle_path = base_path / "unified" / "schemas" / "schema_bundle.json"
-        self._schema_bundle_by_name = {}
-        self._schema_bundle_routes = {}
-        if bundle_path.exists():
-            bundle = json.loads(bundle_path.read_text(encoding="utf-8"))
-            http_bundle = bundle.get("http") or {}
-            schemas_by_name = http_bundle.get("schemasByName") or http_bundle.get(
-                "byName"
-            )
-            if isinstance(schemas_by_name, dict):
-                self._schema_bundle_by_name = {
-                    name: schema
-                    for name, schema in schemas_by_name.items()
-                    if isinstance(schema, dict)
-                }
-            routes = http_bundle.get("routes") or http_bundle.get("byRoute") or {}
-            for route_key, route_entry in routes.items():
-                if not isinstance(route_key, str):
-                    continue
-                if isinstance(route_entry, str):
-                    route_entry = {"request": route_entry}
-                if not isinstance(route_entry, dict):
-                    continue
-                method, _, path = route_key.partition(" ")
-                if not method or not path:
-                    continue
-                key = self._normalize_route_key(method, path)
-                self._schema_bundle_routes[key] = route_entry
-            route_map: Dict[Tuple[str, str], Union[Path, Dict[str, Any]]] = {}
-            for key, route_entry in self._schema_bundle_routes.items():
-                request_name = route_entry.get("request")
-                if isinstance(request_name, dict):
-                    route_map[key] = request_name
-                elif isinstance(request_name, str):
-                    schema = self._schema_bundle_by_name.get(request_name)
-                    if isinstance(schema, dict):
-                        route_map[key] = schema
-            return route_map
-
-        endpoints_path = (
-            base_path / "unified" / "data" / "api_full" / "http_endpoints.json"
-        )
-        schemas_root = base_path / "unified" / "schemas" / "http"
-        if not endpoints_path.exists() or not schemas_root.exists():
-            return {}
-        endpoints = json.loads(endpoints_path.read_text(encoding="utf-8"))
-        route_map = {}
-        for endpoint in endpoints:
-            method = str(endpoint.get("method", "")).upper()
-            path = str(endpoint.get("path", ""))
-            ref = endpoint.get("requestBodyRef")
-            if not method or not path or not ref:
-                continue
-            body_name = str(ref).split("/")[-1]
-            schema_path = schemas_root / f"{body_name}.json"
-            if schema_path.exists():
-                route_map[self._normalize_route_key(method, path)] = schema_path
-        return route_map
-
-    def _load_query_params_by_route(self) -> Dict[Tuple[str, str], List[str]]:
-        if self._schema_bundle_routes:
-            bundle_params: Dict[Tuple[str, str], List[str]] = {}
-            for route_key, route_entry in self._schema_bundle_routes.items():
-                params = route_entry.get("queryParams")
-                if not isinstance(params, list):
-                    continue
-                cleaned = [
-                    name for name in params if isinstance(name, str) and name.strip()
-                ]
-                if cleaned:
-                    bundle_params[route_key] = cleaned
-            return bundle_params
-
-        base_path = Path(__file__).resolve().parents[2]
-        endpoints_path = (
-            base_path
-            / "unified"
-            / "data"
-            / "api_extracted"
-            / "stellina_api_endpoints.json"
-        )
-        if not endpoints_path.exists():
-            return {}
-        endpoints = json.loads(endpoints_path.read_text(encoding="utf-8"))
-        route_map: Dict[Tuple[str, str], List[str]] = {}
-        for endpoint in endpoints:
-            method = str(endpoint.get("http_method", "")).upper()
-            path = str(endpoint.get("path", ""))
-            if not method or not path:
-                continue
-            params: List[str] = []
-            for param in endpoint.get("params", []) or []:
-                for annotation in param.get("annotations", []) or []:
-                    if str(annotation.get("kind", "")).lower() != "query":
-                        continue
-                    elements = annotation.get("elements") or {}
-                    name = elements.get("value")
-                    if isinstance(name, str) and name:
-                        params.append(name)
-            if not params:
-                continue
-            key = self._normalize_route_key(method, path)
-            if key in route_map:
-                existing = set(route_map[key])
-                for name in params:
-                    if name not in existing:
-                        route_map[key].append(name)
-            else:
-                route_map[key] = params
-        return route_map
-
     def _load_schema(self, schema_path: Path) -> Dict[str, Any]:
-        cached = self._schema_cache.get(schema_path)
-        if cached is not None:
-            return cached
-        data = json.loads(schema_path.read_text(encoding="utf-8"))
-        self._schema_cache[schema_path] = data
-        return data
+        return _load_schema_cached(str(schema_path))
+
+    def _get_request_schema(
+        self, info: Optional[_RouteInfo]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Path]]:
+        """Resolve a route's request schema on first use.
+
+        The route table stores unresolved byName references and unprobed
+        schema paths; only the operation the user actually selects pays
+        the lookup or file read. The resolved schema (or a miss) replaces
+        the stored entry so repeat selections are a plain probe.
+        """
+        if info is None or info.request_schema is None:
+            return None, None
+        entry = info.request_schema
+        if isinstance(entry, dict):
+            return entry, None
+        if isinstance(entry, str):
+            schema = self._schema_bundle_by_name.get(entry)
+            if not isinstance(schema, dict):
+                schema = None
+            info.request_schema = schema
+            return schema, None
+        try:
+            return self._load_schema(entry), entry
+        except OSError:
+            info.request_schema = None
+            return None, None
 
     def _resolve_schema_ref(
         self, ref: str, base_path: Optional[Path]
@@ -1777,6 +2271,27 @@ class BarnardControlApp:
         schema: Dict[str, Any],
         schema_path: Optional[Path],
         depth: int = 0,
+    ) -> Any:
+        # Bundles reuse the same sub-schema objects across many routes;
+        # memoizing on identity (with the schema pinned in the value so
+        # the id stays valid) collapses repeated expansions. The key also
+        # carries depth and schema_path because the expansion depends on
+        # both: the depth cutoff truncates deep reaches and relative
+        # $refs resolve against the path. Callers get a deep copy so
+        # nobody can poison the cached example.
+        key = (id(schema), depth, schema_path)
+        cached = self._schema_example_cache.get(key)
+        if cached is not None and cached[0] is schema:
+            return copy.deepcopy(cached[1])
+        example = self._schema_example_uncached(schema, schema_path, depth)
+        self._schema_example_cache[key] = (schema, example)
+        return copy.deepcopy(example)
+
+    def _schema_example_uncached(
+        self,
+        schema: Dict[str, Any],
+        schema_path: Optional[Path],
+        depth: int = 0,
     ) -> Any:
         if depth > 4:
             return None
@@ -1828,30 +2343,20 @@ class BarnardControlApp:
         self.params_text.delete("1.0", tk.END)
         self.body_text.delete("1.0", tk.END)
 
-        route_key = self._normalize_route_key(method, path)
-        query_params = self._query_params_by_route.get(route_key)
+        route_info = self._routes.get(_normalize_route_key(method, path))
+        query_params = route_info.query_params if route_info else None
         if query_params:
             params_payload = {name: "" for name in query_params}
-            self.params_text.insert(
-                tk.END,
-                json.dumps(params_payload, indent=2, sort_keys=True, ensure_ascii=True),
-            )
+            self.params_text.insert(tk.END, dumps_pretty(params_payload))
         else:
             self.params_text.insert(tk.END, "{}")
 
-        schema_entry = self._request_schema_by_route.get(route_key)
-        schema = None
-        schema_path = None
-        if isinstance(schema_entry, Path):
-            schema_path = schema_entry
-            schema = self._load_schema(schema_path)
-        elif isinstance(schema_entry, dict):
-            schema = schema_entry
+        schema, schema_path = self._get_request_schema(route_info)
         if schema is not None:
             example = self._schema_example(schema, schema_path)
             if example is None:
                 example = {}
-            body_text = json.dumps(example, indent=2, sort_keys=True, ensure_ascii=True)
+            body_text = dumps_pretty(example)
             self.body_text.insert(tk.END, body_text)
             return
 
@@ -1917,8 +2422,7 @@ class BarnardControlApp:
             status = result.get("status")
             auth_header = result.get("auth")
             if status is not None:
-                self._update_status_cache(status)
-                self._update_image_url_from_status(status)
+                self._ingest_status(status)
             if auth_header:
                 self.auth_header = auth_header
                 self.auth_header_var.set(auth_header)
@@ -2008,10 +2512,12 @@ class BarnardControlApp:
         if self.socket_client:
             self.socket_client.send_command(command, payload)
 
-    def _fetch_image(self) -> None:
+    def _fetch_image(self, on_complete: Optional[Callable[[], None]] = None) -> None:
         url = self.image_url_var.get().strip()
         if not url:
             messagebox.showerror("Missing URL", "Enter an image URL or path.")
+            if on_complete is not None:
+                on_complete()
             return
 
         def action() -> Tuple[bytes, Optional[str]]:
@@ -2030,26 +2536,48 @@ class BarnardControlApp:
             self._display_image(data)
             self._render_status_card()
 
-        self._run_in_thread(action, done)
+        self._run_in_thread(action, done, on_complete)
 
     def _start_live_view(self) -> None:
         if self.live_view_running:
             return
         self.live_view_running = True
-        self._schedule_live_view()
+        self._live_tick()
 
     def _stop_live_view(self) -> None:
         self.live_view_running = False
+        if self._live_after_id is not None:
+            try:
+                self.root.after_cancel(self._live_after_id)
+            except tk.TclError:
+                pass
+            self._live_after_id = None
 
-    def _schedule_live_view(self) -> None:
+    def _live_tick(self) -> None:
+        # One timer and at most one fetch in flight: a tick that lands
+        # while the previous fetch is still running just reschedules, so
+        # slow links never stack requests.
+        self._live_after_id = None
         if not self.live_view_running:
             return
-        self._fetch_image()
+        if self._live_in_flight:
+            self._schedule_live_tick()
+            return
+        self._live_in_flight = True
+        self._fetch_image(on_complete=self._live_fetch_done)
+
+    def _live_fetch_done(self) -> None:
+        self._live_in_flight = False
+        self._schedule_live_tick()
+
+    def _schedule_live_tick(self) -> None:
+        if not self.live_view_running or self._live_after_id is not None:
+            return
         try:
             interval = float(self.live_interval_var.get().strip())
         except ValueError:
             interval = 2.0
-        self.root.after(int(interval * 1000), self._schedule_live_view)
+        self._live_after_id = self.root.after(int(interval * 1000), self._live_tick)
 
     def _save_image(self) -> None:
         if not self.last_image_bytes:
@@ -2073,70 +2601,153 @@ class BarnardControlApp:
         self.gui_log.logger.info("Saved image to %s", path)
 
     def _display_image(self, data: bytes) -> None:
+        # Live view re-fetches on a timer whether or not the frame moved;
+        # hashing the bytes skips the decode + PhotoImage rebuild when the
+        # server returned the identical image.
+        digest = hashlib.sha256(data).digest()
+        if digest == self._last_image_hash and self._image_tk is not None:
+            return
+        # Release the previous frame's Tk backing store before decoding
+        # the next one so peak memory holds one frame, not two.
+        self._image_tk = None
         try:
             if PIL_AVAILABLE:
                 image = Image.open(io.BytesIO(data))
-                image.thumbnail((900, 600))
+                # Bilinear is visually fine for a preview and decodes
+                # noticeably faster than the default Lanczos filter.
+                image.thumbnail((900, 600), Image.Resampling.BILINEAR)
                 self._image_tk = ImageTk.PhotoImage(image)
                 self.image_label.configure(image=self._image_tk, text="")
             else:
                 self._image_tk = tk.PhotoImage(data=data)
                 self.image_label.configure(image=self._image_tk, text="")
+            self._last_image_hash = digest
         except Exception as exc:
             self.gui_log.logger.exception("Failed to display image: %s", exc)
             self.image_label.configure(text="Image loaded (preview failed)")
 
+    # Payloads longer than this render through the virtual window; Tk Text
+    # costs scale with total content, so multi-MB responses only ever hold
+    # one window's worth of lines.
+    _RESPONSE_VIEW_LINES = 2000
+
     def _set_response(self, result: Any) -> None:
+        rendered = _format_json(result)
+        lines = rendered.split("\n")
+        if len(lines) > self._RESPONSE_VIEW_LINES:
+            self._response_lines = lines
+            self._render_response_window(0)
+            return
+        self._response_lines = None
         self.response_text.configure(state="normal")
         self.response_text.delete("1.0", tk.END)
-        rendered = _format_json(result)
         self.response_text.insert(tk.END, rendered)
         self._apply_json_tags(self.response_text, rendered)
         self.response_text.configure(state="disabled")
 
+    def _render_response_window(self, top: int) -> None:
+        lines = self._response_lines
+        if lines is None:
+            return
+        window = self._RESPONSE_VIEW_LINES
+        top = max(0, min(top, len(lines) - window))
+        self._response_top = top
+        chunk = "\n".join(lines[top : top + window])
+        self.response_text.configure(state="normal")
+        self.response_text.delete("1.0", tk.END)
+        self.response_text.insert(tk.END, chunk)
+        self._apply_json_tags(self.response_text, chunk)
+        self.response_text.configure(state="disabled")
+
+    def _response_yview(self, *args: str) -> None:
+        # Scrollbar command: on a virtualized payload this pages the
+        # Python-side buffer instead of asking Tk to move megabytes.
+        if self._response_lines is None:
+            self.response_text.yview(*args)
+            return
+        if not args:
+            return
+        if args[0] == "moveto":
+            top = int(float(args[1]) * len(self._response_lines))
+        elif args[0] == "scroll":
+            count = int(args[1])
+            step = self._RESPONSE_VIEW_LINES // 2 if args[2] == "pages" else 3
+            top = self._response_top + count * step
+        else:
+            return
+        self._render_response_window(top)
+
+    def _on_response_wheel(self, event: "tk.Event[tk.Text]") -> Optional[str]:
+        # Small payloads keep the default Text scrolling; virtualized
+        # ones page the Python-side buffer and swallow the event.
+        if self._response_lines is None:
+            return None
+        num = getattr(event, "num", None)
+        if num == 4:
+            count = -1
+        elif num == 5:
+            count = 1
+        else:
+            count = -1 if event.delta > 0 else 1
+        self._response_yview("scroll", str(count), "units")
+        return "break"
+
+    def _on_response_key(self, event: "tk.Event[tk.Text]") -> Optional[str]:
+        if self._response_lines is None:
+            return None
+        keysym = event.keysym
+        if keysym in ("Prior", "Next"):
+            self._response_yview("scroll", "-1" if keysym == "Prior" else "1", "pages")
+        elif keysym in ("Up", "Down"):
+            self._response_yview("scroll", "-1" if keysym == "Up" else "1", "units")
+        else:
+            return None
+        return "break"
+
+    def _on_response_yscroll(self, first: str, last: str) -> None:
+        if not hasattr(self, "_response_scroll"):
+            return
+        if self._response_lines is None:
+            self._response_scroll.set(first, last)
+            return
+        # Map the widget's position inside the rendered window back to a
+        # fraction of the whole buffer so the thumb reflects the payload.
+        total = len(self._response_lines)
+        window = min(self._RESPONSE_VIEW_LINES, total)
+        top = self._response_top
+        self._response_scroll.set(
+            str((top + float(first) * window) / total),
+            str((top + float(last) * window) / total),
+        )
+
     def _apply_json_tags(self, widget: tk.Text, content: str) -> None:
         for tag in ("json_key", "json_string", "json_number", "json_bool"):
             widget.tag_remove(tag, "1.0", tk.END)
-        for line_no, line in enumerate(content.splitlines(), start=1):
-            match = re.match(r'(\s*)("[^"]+")(\s*:\s*)(.*)', line)
-            if not match:
-                continue
-            _, key, _, rest = match.groups()
-            key_start = line.find(key)
-            if key_start >= 0:
-                key_end = key_start + len(key)
-                widget.tag_add(
-                    "json_key", f"{line_no}.{key_start}", f"{line_no}.{key_end}"
-                )
-            value_start = line.find(rest, key_start + len(key))
-            if value_start < 0:
-                continue
-            stripped = rest.lstrip()
-            offset = value_start + (len(rest) - len(stripped))
-            if stripped.startswith('"'):
-                end = stripped.find('"', 1)
-                if end != -1:
-                    widget.tag_add(
-                        "json_string",
-                        f"{line_no}.{offset}",
-                        f"{line_no}.{offset + end + 1}",
-                    )
-            else:
-                number_match = re.match(r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?", stripped)
-                if number_match:
-                    widget.tag_add(
-                        "json_number",
-                        f"{line_no}.{offset}",
-                        f"{line_no}.{offset + len(number_match.group(0))}",
-                    )
-                else:
-                    bool_match = re.match(r"(true|false|null)\b", stripped)
-                    if bool_match:
-                        widget.tag_add(
-                            "json_bool",
-                            f"{line_no}.{offset}",
-                            f"{line_no}.{offset + len(bool_match.group(0))}",
-                        )
+        # One pass over '\n' builds a line-start table so every match
+        # offset maps to a line.col index with a bisect instead of a
+        # per-line rescan.
+        line_starts = [0]
+        pos = content.find("\n")
+        while pos != -1:
+            line_starts.append(pos + 1)
+            pos = content.find("\n", pos + 1)
+        ranges: Dict[str, List[str]] = {
+            "json_key": [],
+            "json_string": [],
+            "json_number": [],
+            "json_bool": [],
+        }
+        for match in _JSON_TAG_RE.finditer(content):
+            start, end = match.span()
+            line = bisect.bisect_right(line_starts, start)
+            end_line = bisect.bisect_right(line_starts, end)
+            pairs = ranges[match.lastgroup]
+            pairs.append(f"{line}.{start - line_starts[line - 1]}")
+            pairs.append(f"{end_line}.{end - line_starts[end_line - 1]}")
+        # tag_add takes many index pairs at once: one Tcl call per tag.
+        for tag, pairs in ranges.items():
+            if pairs:
+                widget.tag_add(tag, *pairs)
 
     def _build_http_client(self) -> UnifiedHTTPClient:
         host = self.host_var.get().strip()
@@ -2173,54 +2784,67 @@ class BarnardControlApp:
         self.root.after(0, self._refresh_auth_and_status)
 
     def _handle_socket_status(self, payload: Any) -> None:
-        if isinstance(payload, dict):
-            self._update_status_cache(payload)
-            self._update_image_url_from_status(payload)
-
-    def _update_status_cache(self, status: Any) -> None:
-        if isinstance(status, dict):
-            self.last_status = status
-            self._update_status_controls(status)
-            self._update_status_summary(status)
-            self._maybe_sync_time(status)
-
-    def _update_image_url_from_status(self, status: Any) -> None:
+        # Fires on the socketio event thread; intake drives Tk widgets
+        # (and can lazily build tabs), so marshal onto the Tk loop first.
+        self.root.after(0, lambda p=payload: self._ingest_status(p))
+
+    def _ingest_status(self, status: Any) -> None:
+        """Single-pass intake for a fresh status payload.
+
+        Flattens the payload once and feeds the result to the tree, the
+        summary and the image-url hook, instead of each of them re-walking
+        the same structure on every status event.
+        """
+        if not isinstance(status, dict):
+            return
+        self.last_status = status
+        snapshot = _StatusSnapshot.from_payload(status)
+        self._status_snapshot = snapshot
+        flat_pairs = self._flatten_status_pairs(status)
+        self._update_status_controls(status, pairs=flat_pairs)
+        self._update_status_summary(status, flattened=dict(zip(*flat_pairs)))
+        self._maybe_sync_time(status, snapshot=snapshot)
+        self._update_image_url_from_status(status, snapshot=snapshot)
+
+    def _update_image_url_from_status(
+        self, status: Any, *, snapshot: Optional[_StatusSnapshot] = None
+    ) -> None:
         urls = _find_image_urls(status)
         if not urls:
             return
         url = urls[0]
         self.image_url_var.set(url)
-        if self._should_auto_live_view(status) and not self.live_view_running:
+        should_start = self._should_auto_live_view(status, snapshot=snapshot)
+        if should_start and not self.live_view_running:
             self._start_live_view()
             if self._notebook is not None:
                 self._notebook.select(self.image_tab)
 
-    def _should_auto_live_view(self, status: Any) -> bool:
+    def _should_auto_live_view(
+        self, status: Any, *, snapshot: Optional[_StatusSnapshot] = None
+    ) -> bool:
         if not self.auto_live_var.get():
             return False
-        if not isinstance(status, dict):
-            return True
-        result = status.get("result")
-        if isinstance(result, dict):
-            current = result.get("currentOperation")
-            if isinstance(current, dict):
-                state = current.get("state")
-                if isinstance(state, str):
-                    lowered = state.lower()
-                    idle_tokens = (
-                        "idle",
-                        "none",
-                        "stopped",
-                        "finished",
-                        "complete",
-                        "done",
-                    )
-                    if any(token in lowered for token in idle_tokens):
-                        return False
+        if snapshot is None:
+            if not isinstance(status, dict):
+                return True
+            snapshot = _StatusSnapshot.from_payload(status)
+        state = snapshot.operation_state
+        if isinstance(state, str):
+            lowered = state.lower()
+            if any(token in lowered for token in _IDLE_STATE_TOKENS):
+                return False
         return True
 
-    def _flatten_status(self, payload: Any) -> Dict[str, str]:
-        flattened: Dict[str, str] = {}
+    def _flatten_status_pairs(self, payload: Any) -> Tuple[List[str], List[str]]:
+        """Flatten a status payload into parallel key/value lists.
+
+        The structure-of-arrays form lets the status tree update iterate the
+        walk results without building (and hashing into) an intermediate
+        dict on every status tick.
+        """
+        keys: List[str] = []
+        values: List[str] = []
 
         def walk(value: Any, prefix: str = "") -> None:
             if isinstance(value, dict):
@@ -2228,25 +2852,33 @@ class BarnardControlApp:
                     path = f"{prefix}.{key}" if prefix else key
                     if isinstance(val, dict):
                         if not val:
-                            flattened[path] = "{}"
+                            keys.append(path)
+                            values.append("{}")
                         walk(val, path)
                     elif isinstance(val, list):
                         if len(val) > 20:
-                            flattened[path] = f"<list length {len(val)}>"
+                            keys.append(path)
+                            values.append(f"<list length {len(val)}>")
                         else:
                             walk(val, path)
                     else:
-                        flattened[path] = self._stringify_value(val)
+                        keys.append(path)
+                        values.append(self._stringify_value(val))
             elif isinstance(value, list):
                 for idx, item in enumerate(value):
                     path = f"{prefix}[{idx}]"
                     if isinstance(item, (dict, list)):
                         walk(item, path)
                     else:
-                        flattened[path] = self._stringify_value(item)
+                        keys.append(path)
+                        values.append(self._stringify_value(item))
 
         walk(payload)
-        return flattened
+        return keys, values
+
+    def _flatten_status(self, payload: Any) -> Dict[str, str]:
+        keys, values = self._flatten_status_pairs(payload)
+        return dict(zip(keys, values))
 
     def _extract_device_timestamp(self, status: Any) -> Optional[int]:
         if not isinstance(status, dict):
@@ -2264,25 +2896,7 @@ class BarnardControlApp:
         return None
 
     def _normalize_timestamp_to_ms(self, value: Any) -> Optional[int]:
-        if isinstance(value, bool):
-            return None
-        if isinstance(value, (int, float)):
-            numeric = float(value)
-        elif isinstance(value, str):
-            stripped = value.strip()
-            if not stripped:
-                return None
-            try:
-                numeric = float(stripped)
-            except ValueError:
-                return None
-        else:
-            return None
-        if numeric <= 0:
-            return None
-        if numeric < 1e11:
-            return int(numeric * 1000)
-        return int(numeric)
+        return _TS_NORMALIZERS.get(type(value), _ts_unsupported)(value)
 
     def _set_time_sync_notice(self, drift_ms: Optional[int], *, note: str = "") -> None:
         if self.time_sync_notice_label is None:
@@ -2297,10 +2911,16 @@ class BarnardControlApp:
         self.time_sync_notice_var.set(message)
         self.time_sync_notice_label.grid()
 
-    def _maybe_sync_time(self, status: Any) -> None:
+    def _maybe_sync_time(
+        self, status: Any, *, snapshot: Optional[_StatusSnapshot] = None
+    ) -> None:
         if self.socket_client is None:
             return
-        device_ms = self._extract_device_timestamp(status)
+        device_ms: Optional[int] = None
+        if snapshot is not None:
+            device_ms = self._normalize_timestamp_to_ms(snapshot.timestamp)
+        if device_ms is None:
+            device_ms = self._extract_device_timestamp(status)
         if device_ms is None:
             self._set_time_sync_notice(None)
             return
@@ -2321,10 +2941,17 @@ class BarnardControlApp:
             "Auto time sync issued (device_ms=%s drift_ms=%s)", device_ms, drift_ms
         )
 
-    def _build_status_summary_lines(self, status: Any, max_lines: int = 5) -> List[str]:
+    def _build_status_summary_lines(
+        self,
+        status: Any,
+        max_lines: int = 5,
+        *,
+        flattened: Optional[Dict[str, str]] = None,
+    ) -> List[str]:
         if not isinstance(status, dict):
             return []
-        flattened = self._flatten_status(status)
+        if flattened is None:
+            flattened = self._flatten_status(status)
         preferred = [
             "result.telescopeId",
             "result.instrumentState",
@@ -2456,7 +3083,7 @@ class BarnardControlApp:
                 )
                 return
             except Exception as exc:
-                self.gui_log.logger.debug("Status preview render failed: %s", exc)
+                self.gui_debug("Status preview render failed: %s", exc)
 
         fg = self._theme["text"] if self._theme else "black"
         canvas.create_text(
@@ -2470,8 +3097,12 @@ class BarnardControlApp:
             justify="left",
         )
 
-    def _update_status_summary(self, status: Any) -> None:
-        lines = self._build_status_summary_lines(status, max_lines=5)
+    def _update_status_summary(
+        self, status: Any, *, flattened: Optional[Dict[str, str]] = None
+    ) -> None:
+        lines = self._build_status_summary_lines(
+            status, max_lines=5, flattened=flattened
+        )
         if not lines:
             lines = ["(no status yet)"]
         if hasattr(self, "status_summary_var"):
@@ -2486,44 +3117,100 @@ class BarnardControlApp:
             self.status_summary_text.configure(state="disabled")
 
     def _stringify_value(self, value: Any, max_len: int = 200) -> str:
-        if isinstance(value, str):
-            rendered = value
-        else:
-            rendered = str(value)
+        rendered = value if isinstance(value, str) else str(value)
         if len(rendered) > max_len:
-            return rendered[: max_len - 12] + "... (truncated)"
+            return f"{rendered[: max_len - 12]}{_TRUNC_SUFFIX}"
         return rendered
 
-    def _update_status_controls(self, status: Any) -> None:
-        flattened = self._flatten_status(status)
-        if not flattened:
+    def _update_status_controls(
+        self,
+        status: Any,
+        *,
+        pairs: Optional[Tuple[List[str], List[str]]] = None,
+    ) -> None:
+        flat_keys, flat_values = (
+            pairs if pairs is not None else self._flatten_status_pairs(status)
+        )
+        if not flat_keys:
             return
 
         if not self.socket_device_var.get().strip():
-            for key in (
+            wanted = (
                 "result.telescopeId",
                 "telescopeId",
                 "result.deviceId",
                 "deviceId",
-            ):
-                value = flattened.get(key)
-                if value:
-                    self.socket_device_var.set(value)
+            )
+            matches: Dict[str, str] = {}
+            for key, value in zip(flat_keys, flat_values):
+                if key in wanted and value and key not in matches:
+                    matches[key] = value
+            for key in wanted:
+                if key in matches:
+                    self.socket_device_var.set(matches[key])
                     break
 
-        for key, value in flattened.items():
-            existing = self.status_values.get(key)
-            if key in self.status_items:
-                item_id = self.status_items[key]
-                self.status_tree.item(item_id, values=(key, value))
-                if existing is not None and existing != value:
-                    self.status_tree.item(item_id, tags=("changed",))
+        # Diff against the previous snapshot: unchanged rows cost one dict
+        # probe and zero Tcl calls, so a refresh scales with what actually
+        # moved instead of the row count.
+        seen = set()
+        changed_iids: List[str] = []
+        self._freeze_tree()
+        try:
+            for key, value in zip(flat_keys, flat_values):
+                seen.add(key)
+                field = self.status_fields.get(key)
+                if field is not None:
+                    if field.value == value:
+                        continue
+                    item_id = field.tree_iid
+                    self.status_tree.item(
+                        item_id, values=(key, value), tags=("changed",)
+                    )
+                    changed_iids.append(item_id)
                 else:
-                    self.status_tree.item(item_id, tags=())
-            else:
-                item_id = self.status_tree.insert("", tk.END, values=(key, value))
-                self.status_items[key] = item_id
-            self.status_values[key] = value
+                    item_id = self.status_tree.insert("", tk.END, values=(key, value))
+                self.status_fields[key] = _StatusField(item_id, value)
+            for key in [k for k in self.status_fields if k not in seen]:
+                field = self.status_fields.pop(key)
+                try:
+                    self.status_tree.delete(field.tree_iid)
+                except tk.TclError:
+                    pass
+        finally:
+            self._thaw_tree()
+        if changed_iids:
+            self.root.after(1500, lambda: self._clear_changed_tags(changed_iids))
+
+    def _clear_changed_tags(self, iids: List[str]) -> None:
+        for iid in iids:
+            try:
+                self.status_tree.item(iid, tags=())
+            except tk.TclError:
+                pass
+
+    def _freeze_tree(self) -> None:
+        # Blank the display columns while rows churn so the Treeview skips
+        # per-mutation layout; the thaw triggers one relayout for the batch.
+        try:
+            self.status_tree.configure(displaycolumns=())
+        except tk.TclError:
+            pass
+
+    def _thaw_tree(self) -> None:
+        try:
+            self.status_tree.configure(displaycolumns="#all")
+        except tk.TclError:
+            pass
+
+    @property
+    def status_items(self) -> Dict[str, str]:
+        """Key -> tree item id view, kept for callers of the old twin dicts."""
+        return {key: field.tree_iid for key, field in self.status_fields.items()}
+
+    @property
+    def status_values(self) -> Dict[str, str]:
+        return {key: field.value for key, field in self.status_fields.items()}
 
     def _is_debug_operation(self, operation_id: str, path: str) -> bool:
         lowered = f"{operation_id} {path}".lower()
@@ -74,6 +74,18 @@ class VaonisHTTPClient:
     log_payloads: bool = True
     log_payload_limit: int = 4000
 
+    def __post_init__(self) -> None:
+        # Reuse one pooled session so repeated calls to the instrument skip
+        # per-request TCP (and TLS) setup.
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Release pooled connections held by the underlying session."""
+        self._session.close()
+
     def _log(self, message: str, *args: Any) -> None:
         if self.logger is not None:
             self.logger.info(message, *args)
@@ -110,7 +122,7 @@ class VaonisHTTPClient:
         )
         start = time.monotonic()
         try:
-            resp = requests.request(
+            resp = self._session.request(
                 method,
                 url,
                 params=params,
@@ -984,7 +996,7 @@ class VaonisHTTPClient:
         headers: Dict[str, str] = {}
         if auth is not None:
             headers["Authorization"] = auth
-        resp = requests.get(
+        resp = self._session.get(
             full_url, timeout=self.timeout_s, stream=stream, headers=headers
         )
         if stream:
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 import json
 import logging
 from pathlib import Path
 import re
 from typing import Any, Optional
 
+from ._json import dumps_pretty, dumps_pretty_bounded
+
 
 ANSI_RESET = "\033[0m"
 ANSI_BLUE = "\033[94m"
@@ -18,7 +21,10 @@ ANSI_CYAN = "\033[96m"
 ANSI_MAGENTA = "\033[95m"
 
 
+@lru_cache(maxsize=8)
 def find_repo_root(start: Optional[Path] = None) -> Path:
+    # Walking the parents costs a stat per directory; the answer never
+    # changes within a process, so cache it per start point.
     probe = start or Path(__file__).resolve()
     for parent in [probe, *probe.parents]:
         if (parent / ".git").exists() or (parent / "src").exists():
@@ -39,6 +45,15 @@ def make_log_path(prefix: str, *, root: Optional[Path] = None) -> Path:
     return log_dir / f"{prefix}_{stamp}.log"
 
 
+# Formatter instances are stateless; one shared object serves every
+# channel's handlers instead of a fresh instance per configure call.
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s %(levelname)s %(name)s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+@lru_cache(maxsize=32)
 def configure_logger(
     name: str,
     log_path: Path,
@@ -46,24 +61,26 @@ def configure_logger(
     level: int = logging.INFO,
     also_console: bool = False,
 ) -> logging.Logger:
+    """Configure and return a named logger.
+
+    Memoized on the full argument set: repeat calls reuse the configured
+    logger instead of replacing its handlers (and reopening the log file)
+    every time. Handlers are still reset on a cache miss, so reconfiguring
+    with a new path or level stays idempotent.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(level)
     logger.propagate = False
 
-    formatter = logging.Formatter(
-        "%(asctime)s %(levelname)s %(name)s %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
     logger.handlers.clear()
 
     file_handler = logging.FileHandler(log_path, encoding="utf-8")
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(_LOG_FORMATTER)
     logger.addHandler(file_handler)
 
     if also_console:
         stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(formatter)
+        stream_handler.setFormatter(_LOG_FORMATTER)
         logger.addHandler(stream_handler)
 
     return logger
@@ -82,42 +99,47 @@ def setup_logging(prefix: str, *, also_console: bool = False) -> LogContext:
     return LogContext(name=prefix, logger=logger, log_path=log_path)
 
 
-def _colorize_json_line(line: str) -> str:
-    key_match = re.match(r'(\s*)("[^"]+")(\s*:\s*)(.*)', line)
-    if not key_match:
-        return line
-    indent, key, sep, rest = key_match.groups()
-    key_colored = f"{ANSI_BLUE}{key}{ANSI_RESET}"
-    value = rest
-    value_match = re.match(r'"[^"]*"', value)
-    if value_match:
-        token = value_match.group(0)
-        colored = f"{ANSI_GREEN}{token}{ANSI_RESET}"
-        value = colored + value[len(token) :]
-    else:
-        value_match = re.match(r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?", value)
-        if value_match:
-            token = value_match.group(0)
-            colored = f"{ANSI_CYAN}{token}{ANSI_RESET}"
-            value = colored + value[len(token) :]
-        else:
-            value_match = re.match(r"(true|false|null)\b", value)
-            if value_match:
-                token = value_match.group(0)
-                colored = f"{ANSI_MAGENTA}{token}{ANSI_RESET}"
-                value = colored + value[len(token) :]
-    return f"{indent}{key_colored}{sep}{value}"
+# One alternation so colorization is a single pass over the text. A
+# quoted token followed by ':' is a key; other quoted tokens are string
+# values, and the string branch shields embedded digits/literals from
+# the later branches.
+_COLOR_RE = re.compile(
+    r'(?P<key>"[^"\n]*")(?=\s*:)'
+    r'|(?P<string>"[^"\n]*")'
+    r"|(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)"
+    r"|(?P<literal>\b(?:true|false|null)\b)"
+)
+
+_COLOR_BY_GROUP = {
+    "key": ANSI_BLUE,
+    "string": ANSI_GREEN,
+    "number": ANSI_CYAN,
+    "literal": ANSI_MAGENTA,
+}
+
+
+def _colorize_match(match: "re.Match[str]") -> str:
+    color = _COLOR_BY_GROUP[match.lastgroup]
+    return f"{color}{match.group(0)}{ANSI_RESET}"
 
 
 def colorize_json(text: str) -> str:
-    return "\n".join(_colorize_json_line(line) for line in text.splitlines())
+    return _COLOR_RE.sub(_colorize_match, text)
+
+
+def _render_json(value: Any, max_len: int) -> str:
+    # Bounded serialization keeps worst-case work at O(max_len) instead
+    # of serializing megabytes that truncation would throw away.
+    if max_len > 0:
+        return dumps_pretty_bounded(value, max_len)
+    return dumps_pretty(value)
 
 
 def format_payload(value: Any, *, color: bool = False, max_len: int = 4000) -> str:
     if isinstance(value, (bytes, bytearray)):
         rendered = f"<{len(value)} bytes>"
     elif isinstance(value, (dict, list)):
-        rendered = json.dumps(value, indent=2, sort_keys=True, ensure_ascii=True)
+        rendered = _render_json(value, max_len)
     elif isinstance(value, str):
         raw = value.strip()
         if raw:
@@ -126,9 +148,7 @@ def format_payload(value: Any, *, color: bool = False, max_len: int = 4000) -> s
             except Exception:
                 rendered = value
             else:
-                rendered = json.dumps(
-                    parsed, indent=2, sort_keys=True, ensure_ascii=True
-                )
+                rendered = _render_json(parsed, max_len)
         else:
             rendered = value
     else:
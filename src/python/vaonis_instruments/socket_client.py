@@ -24,10 +24,11 @@ This file purposefully does NOT embed any proprietary credentials.
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 import json
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, List, Optional, Tuple
 
 try:
     import socketio  # type: ignore
@@ -55,9 +56,15 @@ class VaonisSocketClient:
                 "Install with: pip install python-socketio python-engineio"
             ) from _import_error
         self._sio = socketio.Client(logger=self.logger, engineio_logger=self.logger)
+        self._batching = False
+        self._pending: List[Tuple[Any, Optional[Callable[..., None]]]] = []
 
     def _log_event(self, event: str, payload: Any) -> None:
-        if self.event_logger is None:
+        # Skip the json.dumps entirely when INFO is disabled; events can
+        # arrive at a high rate and serialization is the expensive part.
+        if self.event_logger is None or not self.event_logger.isEnabledFor(
+            logging.INFO
+        ):
             return
         try:
             payload_repr = json.dumps(payload, ensure_ascii=True)
@@ -134,14 +141,36 @@ class VaonisSocketClient:
             data = [command]
         else:
             data = [command, payload]
-        if self.event_logger is not None:
+        if self.event_logger is not None and self.event_logger.isEnabledFor(
+            logging.INFO
+        ):
             try:
                 payload_repr = json.dumps(data, ensure_ascii=True)
             except TypeError:
                 payload_repr = str(data)
             self.event_logger.info("SOCKET send %s", payload_repr)
+        if self._batching:
+            self._pending.append((data, callback))
+            return
         self._sio.emit("message", data, callback=callback)
 
+    @contextmanager
+    def batch(self) -> Iterator["VaonisSocketClient"]:
+        """Coalesce send_command calls issued inside the block.
+
+        Commands are queued and emitted back to back on exit, preserving
+        order, so a burst of commands shares one write window instead of
+        interleaving with per-command work between emits.
+        """
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            pending, self._pending = self._pending, []
+            for data, callback in pending:
+                self._sio.emit("message", data, callback=callback)
+
     def take_control(self, user_id: Optional[str] = None) -> None:
         payload = {"userId": user_id} if user_id else None
         self.send_command("takeControl", payload)
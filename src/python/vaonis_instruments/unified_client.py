@@ -53,6 +53,21 @@ class UnifiedHTTPClient:
     logger: Optional[logging.Logger] = None
     log_payloads: bool = True
     log_payload_limit: int = 4000
+    pool_size: int = 8
+
+    def __post_init__(self) -> None:
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=requests.adapters.Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD"}),
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _log(self, message: str, *args: Any) -> None:
         if self.logger is not None: